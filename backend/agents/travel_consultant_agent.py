@@ -1,6 +1,6 @@
 """Travel Consultant Agent - AI 기반 여행 상담."""
 
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, Final, List, Optional
 
 from core.logger import logger
 from core.exceptions import AIServiceException
@@ -9,21 +9,15 @@ from tools import places_tool, exchange_tool, translate_tool
 from tools.definitions import CONSULTANT_TOOLS
 
 
-class TravelConsultantAgent:
-    """
-    AI 여행 컨설턴트 Agent.
+class _MissingDict(dict):
+    """format_map용 dict - 없는 키는 '미정'으로 채움."""
 
-    OpenAI GPT를 사용하여 실시간 여행 관련 질의응답 및
-    맞춤 추천을 제공합니다.
-    """
+    def __missing__(self, key: str) -> str:
+        return "미정"
 
-    def __init__(self):
-        """Initialize Travel Consultant Agent."""
-        self.system_prompt = self._build_system_prompt()
 
-    def _build_system_prompt(self) -> str:
-        """시스템 프롬프트 생성."""
-        return """당신은 친절하고 전문적인 AI 여행 컨설턴트입니다.
+# 시스템 프롬프트 (모든 요청에서 동일 - prompt caching 대상)
+CONSULTANT_SYSTEM_PROMPT: Final[str] = """당신은 친절하고 전문적인 AI 여행 컨설턴트입니다.
 사용자의 여행 관련 질문에 도움을 제공합니다.
 
 ## 역할
@@ -48,6 +42,29 @@ class TravelConsultantAgent:
 
 사용자에게 도움이 되는 정보를 제공하세요."""
 
+# 요청마다 달라지는 여행 컨텍스트 메시지
+_TRIP_CONTEXT_TEMPLATE: Final[str] = """## 현재 여행 정보
+- 목적지: {destination}
+- 기간: {period}
+- 현재 위치: {current_location}"""
+
+
+class TravelConsultantAgent:
+    """
+    AI 여행 컨설턴트 Agent.
+
+    OpenAI GPT를 사용하여 실시간 여행 관련 질의응답 및
+    맞춤 추천을 제공합니다.
+    """
+
+    def __init__(self):
+        """Initialize Travel Consultant Agent."""
+        self.system_prompt = self._build_system_prompt()
+
+    def _build_system_prompt(self) -> str:
+        """시스템 프롬프트 생성."""
+        return CONSULTANT_SYSTEM_PROMPT
+
     async def chat(
         self,
         message: str,
@@ -67,20 +84,8 @@ class TravelConsultantAgent:
         """
         logger.info(f"Consultant chat: {message[:50]}...")
 
-        # 컨텍스트 추가
-        context_info = ""
-        if trip_context:
-            context_info = f"""
-
-## 현재 여행 정보
-- 목적지: {trip_context.get('destination', '미정')}
-- 기간: {trip_context.get('period', '미정')}
-- 현재 위치: {trip_context.get('current_location', '미정')}"""
-
-        system_message = self.system_prompt + context_info
-
-        # 메시지 구성
-        messages = [{"role": "system", "content": system_message}]
+        # 메시지 구성 - 고정 시스템 프롬프트를 맨 앞에 두어 prompt caching 적용
+        messages = [{"role": "system", "content": self.system_prompt}]
 
         # 히스토리 추가 (최근 10개만)
         for h in history[-10:]:
@@ -89,23 +94,22 @@ class TravelConsultantAgent:
                 "content": h.get("content", ""),
             })
 
+        # 요청마다 달라지는 컨텍스트는 캐시되는 prefix 뒤에 추가
+        if trip_context:
+            messages.append({
+                "role": "system",
+                "content": _TRIP_CONTEXT_TEMPLATE.format_map(_MissingDict(trip_context)),
+            })
+
         # 현재 메시지 추가
         messages.append({"role": "user", "content": message})
 
-        # Tool handlers 정의
-        tool_handlers = {
-            "search_places": self._handle_search_places,
-            "get_exchange_rate": self._handle_exchange_rate,
-            "translate_text": self._handle_translate,
-            "get_current_trip": self._handle_get_trip,
-        }
-
         if openai_service.is_available():
             try:
                 response = await openai_service.execute_with_tools(
                     messages=messages,
                     tools=CONSULTANT_TOOLS,
-                    tool_handlers=tool_handlers,
+                    tool_handlers=self._get_tool_handlers(),
                     max_iterations=3,
                 )
 
@@ -142,13 +146,7 @@ class TravelConsultantAgent:
         """
         logger.info(f"Consultant stream: {message[:50]}...")
 
-        context_info = ""
-        if trip_context:
-            context_info = f"\n현재 여행: {trip_context.get('destination', '')}"
-
-        system_message = self.system_prompt + context_info
-
-        messages = [{"role": "system", "content": system_message}]
+        messages = [{"role": "system", "content": self.system_prompt}]
 
         for h in history[-10:]:
             messages.append({
@@ -156,12 +154,21 @@ class TravelConsultantAgent:
                 "content": h.get("content", ""),
             })
 
+        if trip_context:
+            messages.append({
+                "role": "system",
+                "content": f"현재 여행: {trip_context.get('destination', '')}",
+            })
+
         messages.append({"role": "user", "content": message})
 
         if openai_service.is_available():
             try:
-                async for chunk in openai_service.chat_completion_stream(
-                    messages=messages
+                async for chunk in openai_service.execute_with_tools_stream(
+                    messages=messages,
+                    tools=CONSULTANT_TOOLS,
+                    tool_handlers=self._get_tool_handlers(),
+                    max_iterations=3,
                 ):
                     yield chunk
                 return
@@ -173,6 +180,15 @@ class TravelConsultantAgent:
         for char in fallback:
             yield char
 
+    def _get_tool_handlers(self) -> Dict[str, Any]:
+        """Tool 이름별 핸들러 매핑."""
+        return {
+            "search_places": self._handle_search_places,
+            "get_exchange_rate": self._handle_exchange_rate,
+            "translate_text": self._handle_translate,
+            "get_current_trip": self._handle_get_trip,
+        }
+
     async def _handle_search_places(
         self,
         query: str,
@@ -235,12 +251,14 @@ class TravelConsultantAgent:
                 lang_name = result["target_language_name"]
                 translation_prompt = f"다음 텍스트를 {lang_name}로 번역해주세요. 발음도 함께 알려주세요:\n\n{text}"
 
-                response = await openai_service.chat_completion(
+                translated = await openai_service.chat_completion(
                     messages=[{"role": "user", "content": translation_prompt}],
                     # max_completion_tokens=500,
+                    temperature=0,  # 같은 문장은 같은 번역 → 응답 캐시 활용
+                    return_shape="content_only",
                 )
 
-                result["translated"] = response["content"]
+                result["translated"] = translated
                 result["needs_ai_translation"] = False
 
             return result
@@ -5,7 +5,7 @@ import json
 import re
 import uuid
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, List, Optional
 
 from core.logger import logger
 from core.exceptions import AIServiceException
@@ -25,21 +25,8 @@ from models.travel import (
 )
 
 
-class TravelPlannerAgent:
-    """
-    여행 일정 생성 Agent.
-
-    OpenAI GPT를 사용하여 사용자 입력을 기반으로
-    최적의 여행 일정을 자동 생성합니다.
-    """
-
-    def __init__(self):
-        """Initialize Travel Planner Agent."""
-        self.system_prompt = self._build_system_prompt()
-
-    def _build_system_prompt(self) -> str:
-        """시스템 프롬프트 생성."""
-        return """전문 여행 플래너 AI. 최적의 여행 일정을 JSON으로 생성.
+# 시스템 프롬프트 (모든 요청에서 동일 - prompt caching 대상)
+PLANNER_SYSTEM_PROMPT: Final[str] = """전문 여행 플래너 AI. 최적의 여행 일정을 JSON으로 생성.
 
 규칙:
 - 하루 4-6개 장소, 09~22시, 식사 3끼 포함
@@ -61,6 +48,23 @@ class TravelPlannerAgent:
 
 출력: JSON {daily_plans: [{day, date, theme, schedules: [{order, time, place, category, duration_min, estimated_cost, description, location: {lat, lng}}]}]}"""
 
+
+class TravelPlannerAgent:
+    """
+    여행 일정 생성 Agent.
+
+    OpenAI GPT를 사용하여 사용자 입력을 기반으로
+    최적의 여행 일정을 자동 생성합니다.
+    """
+
+    def __init__(self):
+        """Initialize Travel Planner Agent."""
+        self.system_prompt = self._build_system_prompt()
+
+    def _build_system_prompt(self) -> str:
+        """시스템 프롬프트 생성."""
+        return PLANNER_SYSTEM_PROMPT
+
     async def generate_plan(
         self,
         destination: str,
@@ -248,7 +252,7 @@ class TravelPlannerAgent:
         # 이렇게 하면 API 호출이 1회로 줄어들어 속도가 크게 향상됨
         if openai_service.is_available():
             try:
-                response = await openai_service.chat_completion(
+                content = await openai_service.chat_completion(
                     messages=[
                         {"role": "system", "content": self.system_prompt},
                         {"role": "user", "content": user_prompt},
@@ -256,10 +260,10 @@ class TravelPlannerAgent:
                     tools=None,  # tool calling 비활성화 - 이미 장소 정보 수집됨
 
                     response_format={"type": "json_object"},
+                    return_shape="content_only",
                 )
 
                 # JSON 파싱
-                content = response["content"]
                 logger.debug(f"AI response content length: {len(content) if content else 0}")
 
                 if not content:
@@ -37,6 +37,9 @@ class Settings(BaseSettings):
     # OpenAI
     openai_api_key: str = ""
     openai_model: str = "gpt-4o-mini"
+    openai_cache_size: int = 256  # 응답 캐시 최대 항목 수 (0이면 비활성화)
+    openai_cache_ttl: int = 3600  # 응답 캐시 유지 시간 (초)
+    openai_max_concurrent: int = 32  # 동시 chat completion 요청 수 제한
 
     # Google AI (Gemini)
     google_api_key: str = ""
@@ -52,6 +55,9 @@ class Settings(BaseSettings):
     exchange_rate_api_key: str = ""
     exchange_rate_base_url: str = "https://api.exchangerate-api.com/v4"
 
+    # Cache
+    cache_dir: str = ".cache"  # 디스크 캐시 디렉터리 (지오코딩 결과 등)
+
     # Server
     api_host: str = "0.0.0.0"
     api_port: int = 8000
@@ -1,5 +1,6 @@
 """Travver Backend - FastAPI Application."""
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
 from typing import Any, Dict
@@ -12,6 +13,8 @@ from core.config import settings
 from core.logger import logger
 from core.exceptions import TravverException, ValidationException, AIServiceException
 from routes import agent_router, travel_router, memories_router
+from services.openai_service import openai_service
+from tools import places_tool, exchange_tool
 
 
 @asynccontextmanager
@@ -22,6 +25,8 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Travver Backend")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Debug mode: {settings.debug}")
+    # uvicorn[standard]은 uvloop이 설치되어 있으면 자동으로 사용 (loop="auto")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     logger.info("=" * 50)
 
     # Log API availability
@@ -44,6 +49,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Travver Backend")
+    await openai_service.aclose()
+    await places_tool.aclose()
+    await exchange_tool.aclose()
 
 
 # Create FastAPI application
@@ -1,8 +1,13 @@
 """OpenAI API service with retry logic and error handling."""
 
+import asyncio
+import hashlib
 import json
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
-from openai import AsyncOpenAI, OpenAIError
+import time
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union
+import orjson
+from openai import AsyncOpenAI, DefaultAioHttpClient, OpenAIError
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -15,22 +20,182 @@ from core.logger import logger
 from core.exceptions import OpenAIException, RateLimitException
 
 
+# 이 값 이하의 temperature로 요청한 응답만 캐시 (결정적인 응답만 재사용)
+_CACHE_MAX_TEMPERATURE = 0.3
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to JSON (비ASCII 문자는 그대로 유지)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+# 오래된 tool 결과를 대체하는 문구
+_ELIDED_TOOL_RESULT = "[elided earlier results]"
+
+
+def _compact(
+    messages: List[Dict[str, Any]],
+    keep_tool: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Elide the content of older tool results to bound the request size.
+
+    Non-tool messages are kept as-is. Tool messages keep their
+    tool_call_id, since OpenAI rejects assistant tool_calls without a
+    matching reply, but only the latest ``keep_tool`` results (and every
+    result of the latest assistant turn) keep their content.
+    ``keep_tool=None`` (the default) keeps every result.
+
+    Opt-in only: any ``tool_choice="auto"`` round may produce the answer
+    from the elided history, and rewriting earlier messages changes the
+    prompt prefix each round, which defeats prompt caching.
+    """
+    if keep_tool is None:
+        return messages
+
+    tool_indexes = [i for i, m in enumerate(messages) if m["role"] == "tool"]
+    if len(tool_indexes) <= keep_tool:
+        return messages
+
+    last_assistant = max(i for i, m in enumerate(messages) if m["role"] == "assistant")
+    keep = set(tool_indexes[-keep_tool:]) if keep_tool > 0 else set()
+    keep.update(i for i in tool_indexes if i > last_assistant)
+
+    return [
+        {**m, "content": _ELIDED_TOOL_RESULT}
+        if m["role"] == "tool" and i not in keep
+        else m
+        for i, m in enumerate(messages)
+    ]
+
+
+# tuple로 고정된 tool 정의별 준비 결과: id -> (원본, 정규화된 tools, JSON 지문)
+_prepared_tools: Dict[int, Tuple[Sequence[Dict[str, Any]], List[Dict[str, Any]], str]] = {}
+
+
+def _canonicalize_tools(tools: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Sort tool parameter properties so the serialized tools are byte-identical.
+
+    OpenAI prompt caching only reuses an exactly matching prefix, and the
+    tool schemas are rendered ahead of the messages.
+    """
+    canonical = []
+    for tool in tools:
+        function = tool["function"]
+        parameters = function.get("parameters")
+        if parameters and "properties" in parameters:
+            parameters = {
+                **parameters,
+                "properties": dict(sorted(parameters["properties"].items())),
+            }
+            function = {**function, "parameters": parameters}
+        canonical.append({**tool, "function": function})
+    return canonical
+
+
+def _prepare_tools(
+    tools: Sequence[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Return canonical tools and a digest of their JSON serialization.
+
+    Frozen (tuple) definitions are prepared once and reused, so the
+    per-request cost is a dict lookup instead of rebuilding the schemas.
+    """
+    frozen = isinstance(tools, tuple)
+    if frozen:
+        prepared = _prepared_tools.get(id(tools))
+        if prepared is not None and prepared[0] is tools:
+            return prepared[1], prepared[2]
+
+    canonical = _canonicalize_tools(tools)
+    tools_json = json.dumps(canonical, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.blake2b(tools_json.encode("utf-8"), digest_size=16).hexdigest()
+
+    if frozen:
+        _prepared_tools[id(tools)] = (tools, canonical, digest)
+    return canonical, digest
+
+
+class _ResponseCache:
+    """chat_completion 응답 LRU 캐시 (TTL 만료 포함)."""
+
+    def __init__(self, capacity: int = 256, ttl: float = 3600.0):
+        """Initialize cache."""
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def compute_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        tools_digest: Optional[str],
+        **options: Any,
+    ) -> bytes:
+        """요청 내용으로 안정적인 캐시 키 생성."""
+        payload = json.dumps(
+            [model, messages, tools_digest, options],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        """Store a response, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+
 class OpenAIService:
     """OpenAI API 서비스."""
 
+    # 모든 엔드포인트가 공유하는 동시 요청 제한 (rate limit 초과로 인한 재시도 폭주 방지)
+    _semaphore = asyncio.Semaphore(settings.openai_max_concurrent)
+
     def __init__(self):
         """Initialize OpenAI client."""
         if not settings.is_openai_configured():
             logger.warning("OpenAI API key not configured")
             self.client = None
         else:
-            self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+            # 동시 요청이 많을 때 httpx 기본 transport보다 aiohttp가 안정적
+            self.client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=DefaultAioHttpClient(),
+            )
         self.model = settings.openai_model
+        self._cache = _ResponseCache(
+            capacity=settings.openai_cache_size,
+            ttl=settings.openai_cache_ttl,
+        )
 
     def is_available(self) -> bool:
         """Check if service is available."""
         return self.client is not None
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP session (앱 종료 시 호출)."""
+        if self.client is not None:
+            await self.client.close()
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -42,22 +207,29 @@ class OpenAIService:
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
-        tools: Optional[List[Dict[str, Any]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         tool_choice: Optional[str] = "auto",
         max_tokens: Optional[int] = None,
         response_format: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        temperature: Optional[float] = None,
+        return_shape: Literal["full", "content_only"] = "full",
+    ) -> Union[Dict[str, Any], Optional[str]]:
         """
         Create a chat completion with optional function calling.
 
+        Responses requested with a low temperature are deterministic enough
+        to be served from an in-process LRU cache.
+
         Args:
             messages: List of message dicts with role and content
             tools: Optional list of tool definitions for function calling
             tool_choice: How to select tools ("auto", "none", or specific)
             max_completion_tokens: Maximum tokens in response
+            temperature: Sampling temperature (None uses the model default)
+            return_shape: "content_only" returns just the message content
 
         Returns:
-            OpenAI response dict
+            OpenAI response dict, or the content string for "content_only"
 
         Raises:
             OpenAIException: On API errors
@@ -65,6 +237,29 @@ class OpenAIService:
         if not self.is_available():
             raise OpenAIException("OpenAI API is not configured")
 
+        prepared_tools, tools_digest = _prepare_tools(tools) if tools else (None, None)
+
+        cache_key = None
+        if (
+            self._cache.capacity > 0
+            and temperature is not None
+            and temperature <= _CACHE_MAX_TEMPERATURE
+        ):
+            cache_key = self._cache.compute_key(
+                self.model,
+                messages,
+                tools_digest,
+                tool_choice=tool_choice if tools else None,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                temperature=temperature,
+                return_shape=return_shape,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug("OpenAI response cache hit")
+                return cached
+
         try:
             kwargs = {
                 "model": self.model,
@@ -74,52 +269,70 @@ class OpenAIService:
             if max_tokens:
                 kwargs["max_tokens"] = max_tokens
 
+            if temperature is not None:
+                kwargs["temperature"] = temperature
+
             if response_format:
                 kwargs["response_format"] = response_format
 
             if tools:
-                kwargs["tools"] = tools
+                kwargs["tools"] = prepared_tools
                 kwargs["tool_choice"] = tool_choice
 
-            logger.debug(f"OpenAI request: {len(messages)} messages, tools: {bool(tools)}, model: {self.model}")
+            logger.debug(
+                "OpenAI request: {} messages, tools: {}, model: {}",
+                len(messages), bool(tools), self.model,
+            )
 
-            response = await self.client.chat.completions.create(**kwargs)
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(**kwargs)
             
             message = response.choices[0].message
             content = message.content
             tool_calls = message.tool_calls or []
             finish_reason = response.choices[0].finish_reason
 
-            # 상세 로깅
-            logger.debug(f"OpenAI response: {response.usage.total_tokens} tokens used")
-            logger.debug(f"  - finish_reason: {finish_reason}")
-            logger.debug(f"  - content length: {len(content) if content else 0}")
-            logger.debug(f"  - tool_calls count: {len(tool_calls)}")
+            # 상세 로깅 (인자는 DEBUG 레벨이 활성화된 경우에만 포맷됨)
+            logger.debug("OpenAI response: {} tokens used", response.usage.total_tokens)
+            logger.debug("  - finish_reason: {}", finish_reason)
+            logger.debug("  - content length: {}", len(content) if content else 0)
+            logger.debug("  - tool_calls count: {}", len(tool_calls))
             if content:
-                logger.debug(f"  - content preview: {content[:200]}...")
-            if tool_calls:
-                for tc in tool_calls:
-                    logger.debug(f"  - tool_call: {tc.function.name}({tc.function.arguments[:100]}...)")
+                logger.opt(lazy=True).debug("  - content preview: {}...", lambda: content[:200])
+            for tc in tool_calls:
+                logger.opt(lazy=True).debug(
+                    "  - tool_call: {}({}...)",
+                    lambda: tc.function.name,
+                    lambda: tc.function.arguments[:100],
+                )
+
+            if return_shape == "content_only":
+                result = content
+            else:
+                result = {
+                    "content": content,
+                    "tool_calls": [
+                        {
+                            "id": tc.id,
+                            "function": {
+                                "name": tc.function.name,
+                                "arguments": tc.function.arguments,
+                            },
+                        }
+                        for tc in tool_calls
+                    ],
+                    "finish_reason": finish_reason,
+                    "usage": {
+                        "prompt_tokens": response.usage.prompt_tokens,
+                        "completion_tokens": response.usage.completion_tokens,
+                        "total_tokens": response.usage.total_tokens,
+                    },
+                }
 
-            return {
-                "content": content,
-                "tool_calls": [
-                    {
-                        "id": tc.id,
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments,
-                        },
-                    }
-                    for tc in tool_calls
-                ],
-                "finish_reason": finish_reason,
-                "usage": {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
-                },
-            }
+            if cache_key is not None:
+                self._cache.set(cache_key, result)
+
+            return result
 
         except OpenAIError as e:
             if "rate_limit" in str(e).lower():
@@ -149,12 +362,14 @@ class OpenAIService:
             raise OpenAIException("OpenAI API is not configured")
 
         try:
-            stream = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                # max_completion_tokens=max_completion_tokens,
-                stream=True,
-            )
+            # 스트리밍 요청도 같은 동시 요청 제한을 공유 (요청 시작 시점을 제한)
+            async with self._semaphore:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    # max_completion_tokens=max_completion_tokens,
+                    stream=True,
+                )
 
             async for chunk in stream:
                 if chunk.choices[0].delta.content:
@@ -164,12 +379,50 @@ class OpenAIService:
             logger.error(f"OpenAI streaming error: {e}")
             raise OpenAIException(str(e))
 
+    async def _run_tool(
+        self,
+        tool_call: Dict[str, Any],
+        tool_handlers: Dict[str, Callable],
+    ) -> Tuple[str, str, str]:
+        """
+        Execute a single tool call.
+
+        Args:
+            tool_call: Tool call dict from chat_completion
+            tool_handlers: Dict mapping tool names to handler functions
+
+        Returns:
+            (tool_call_id, serialized tool result, tool name)
+        """
+        func_name = tool_call["function"]["name"]
+
+        try:
+            func_args = orjson.loads(tool_call["function"]["arguments"])
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid tool arguments: {func_name} - {e}")
+            return tool_call["id"], _dumps({"error": f"Invalid arguments: {e}"}), func_name
+
+        logger.info("Executing tool: {} with args: {}", func_name, func_args)
+
+        if func_name in tool_handlers:
+            try:
+                result = await tool_handlers[func_name](**func_args)
+                tool_result = _dumps(result)
+            except Exception as e:
+                logger.error(f"Tool execution error: {func_name} - {e}")
+                tool_result = _dumps({"error": str(e)})
+        else:
+            tool_result = _dumps({"error": f"Unknown tool: {func_name}"})
+
+        return tool_call["id"], tool_result, func_name
+
     async def execute_with_tools(
         self,
         messages: List[Dict[str, str]],
-        tools: List[Dict[str, Any]],
+        tools: Sequence[Dict[str, Any]],
         tool_handlers: Dict[str, Callable],
         max_iterations: int = 5,
+        keep_tool_results: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Execute chat completion with automatic tool calling loop.
@@ -179,6 +432,9 @@ class OpenAIService:
             tools: Tool definitions
             tool_handlers: Dict mapping tool names to handler functions
             max_iterations: Maximum tool call iterations
+            keep_tool_results: If set, only this many recent tool results
+                are kept in full on non-final iterations (default None
+                keeps all; the final answer always sees every result)
 
         Returns:
             Final response with all tool results
@@ -192,12 +448,15 @@ class OpenAIService:
 
         while iteration < max_iterations:
             iteration += 1
-            logger.debug(f"Tool execution iteration {iteration}/{max_iterations}")
+            logger.debug("Tool execution iteration {}/{}", iteration, max_iterations)
 
+            # 마지막 iteration에서는 tool 사용을 막아 루프 안에서 최종 응답을 받음
+            # (최종 응답은 모든 tool 결과를 요약하므로 생략 없이 전체 히스토리를 보냄)
+            final = iteration == max_iterations
             response = await self.chat_completion(
-                messages=current_messages,
+                messages=current_messages if final else _compact(current_messages, keep_tool_results),
                 tools=tools,
-                tool_choice="auto" if iteration < max_iterations else "none",
+                tool_choice="none" if final else "auto",
             )
 
             # If no tool calls, return the response
@@ -237,27 +496,16 @@ class OpenAIService:
             }
             current_messages.append(assistant_message)
 
-            # Execute each tool call
-            for tool_call in response["tool_calls"]:
-                func_name = tool_call["function"]["name"]
-                func_args = json.loads(tool_call["function"]["arguments"])
+            # Execute tool calls concurrently (결과 순서는 tool_calls 순서 유지)
+            results = await asyncio.gather(
+                *(self._run_tool(tc, tool_handlers) for tc in response["tool_calls"])
+            )
 
-                logger.info(f"Executing tool: {func_name} with args: {func_args}")
+            for tool_call_id, tool_result, func_name in results:
                 tools_used.append(func_name)
-
-                if func_name in tool_handlers:
-                    try:
-                        result = await tool_handlers[func_name](**func_args)
-                        tool_result = json.dumps(result, ensure_ascii=False)
-                    except Exception as e:
-                        logger.error(f"Tool execution error: {func_name} - {e}")
-                        tool_result = json.dumps({"error": str(e)})
-                else:
-                    tool_result = json.dumps({"error": f"Unknown tool: {func_name}"})
-
                 current_messages.append({
                     "role": "tool",
-                    "tool_call_id": tool_call["id"],
+                    "tool_call_id": tool_call_id,
                     "content": tool_result,
                 })
 
@@ -273,6 +521,155 @@ class OpenAIService:
             "iterations": iteration,
         }
 
+    async def execute_with_tools_stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Sequence[Dict[str, Any]],
+        tool_handlers: Dict[str, Callable],
+        max_iterations: int = 5,
+        keep_tool_results: Optional[int] = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Streaming variant of execute_with_tools.
+
+        Content tokens are yielded as they arrive. Each tool call is
+        dispatched as soon as its arguments are fully streamed, so tool
+        execution overlaps with the model generating the remaining calls.
+
+        Args:
+            messages: Initial messages
+            tools: Tool definitions
+            tool_handlers: Dict mapping tool names to handler functions
+            max_iterations: Maximum tool call iterations
+            keep_tool_results: If set, only this many recent tool results
+                are kept in full on non-final iterations (default None
+                keeps all; the final answer always sees every result)
+
+        Yields:
+            Content chunks as they arrive
+
+        Raises:
+            OpenAIException: On API errors
+        """
+        if not self.is_available():
+            raise OpenAIException("OpenAI API is not configured")
+
+        current_messages = messages.copy()
+        canonical_tools, _ = _prepare_tools(tools)
+        tasks: Dict[int, asyncio.Task] = {}
+        # 이전 iteration에서 스트리밍한 텍스트와 다음 텍스트 사이에 넣을 구분자 필요 여부
+        pending_separator = False
+
+        try:
+            for iteration in range(1, max_iterations + 1):
+                logger.debug("Streaming tool iteration {}/{}", iteration, max_iterations)
+
+                # 최종 응답은 모든 tool 결과를 요약하므로 생략 없이 전체 히스토리를 보냄
+                final = iteration == max_iterations
+                async with self._semaphore:
+                    stream = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=current_messages if final else _compact(current_messages, keep_tool_results),
+                        tools=canonical_tools,
+                        tool_choice="none" if final else "auto",
+                        stream=True,
+                    )
+
+                content_parts: List[str] = []
+                calls: Dict[int, Dict[str, Any]] = {}
+                tasks = {}
+                finish_reason = None
+
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+                    finish_reason = chunk.choices[0].finish_reason or finish_reason
+
+                    if delta.content:
+                        if pending_separator:
+                            yield "\n\n"
+                            pending_separator = False
+                        content_parts.append(delta.content)
+                        yield delta.content
+
+                    for tc_delta in delta.tool_calls or []:
+                        index = tc_delta.index
+                        if index not in calls:
+                            # 새 tool call이 시작되면 이전 호출의 인자는 모두 도착한 상태
+                            for prev_index, prev_call in calls.items():
+                                if prev_index not in tasks:
+                                    tasks[prev_index] = asyncio.create_task(
+                                        self._run_tool(prev_call, tool_handlers)
+                                    )
+                            calls[index] = {"id": "", "function": {"name": "", "arguments": ""}}
+
+                        call = calls[index]
+                        if tc_delta.id:
+                            call["id"] = tc_delta.id
+                        if tc_delta.function:
+                            if tc_delta.function.name:
+                                call["function"]["name"] += tc_delta.function.name
+                            if tc_delta.function.arguments:
+                                call["function"]["arguments"] += tc_delta.function.arguments
+
+                # Tool call이 없으면 응답 완료
+                if not calls:
+                    if content_parts:
+                        return
+                    # content도 비어있으면 (length, content_filter 등) 아래에서 tool 없이 다시 요청
+                    logger.warning(
+                        "Empty streamed content with no tool calls (finish_reason: {}), retrying without tools",
+                        finish_reason,
+                    )
+                    break
+
+                if content_parts:
+                    pending_separator = True
+
+                for index, call in calls.items():
+                    if index not in tasks:
+                        tasks[index] = asyncio.create_task(self._run_tool(call, tool_handlers))
+
+                ordered = sorted(calls)
+                results = await asyncio.gather(*(tasks[i] for i in ordered))
+
+                current_messages.append({
+                    "role": "assistant",
+                    "content": "".join(content_parts),
+                    "tool_calls": [
+                        {
+                            "id": calls[i]["id"],
+                            "type": "function",
+                            "function": calls[i]["function"],
+                        }
+                        for i in ordered
+                    ],
+                })
+                for tool_call_id, tool_result, _ in results:
+                    current_messages.append({
+                        "role": "tool",
+                        "tool_call_id": tool_call_id,
+                        "content": tool_result,
+                    })
+
+        except OpenAIError as e:
+            logger.error(f"OpenAI streaming error: {e}")
+            raise OpenAIException(str(e))
+
+        finally:
+            # 스트림이 중간에 끊기면 실행 중인 tool도 정리
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+
+        # Max iterations reached 또는 빈 응답 - tool 없이 최종 응답 스트리밍
+        async for chunk in self.chat_completion_stream(messages=current_messages):
+            if pending_separator:
+                yield "\n\n"
+                pending_separator = False
+            yield chunk
+
 
 # Singleton instance
 openai_service = OpenAIService()
@@ -1,7 +1,11 @@
-"""Tool definitions for OpenAI function calling."""
+"""Tool definitions for OpenAI function calling.
+
+매 요청마다 동일한 순서로 전송되어야 OpenAI prompt caching이 적용되므로
+수정할 수 없는 tuple로 정의합니다.
+"""
 
 # Travel Planner Agent용 도구 정의
-TRAVEL_PLANNER_TOOLS = [
+TRAVEL_PLANNER_TOOLS = (
     {
         "type": "function",
         "function": {
@@ -81,10 +85,10 @@ TRAVEL_PLANNER_TOOLS = [
             },
         },
     },
-]
+)
 
 # Travel Consultant Agent용 도구 정의
-CONSULTANT_TOOLS = [
+CONSULTANT_TOOLS = (
     {
         "type": "function",
         "function": {
@@ -174,4 +178,4 @@ CONSULTANT_TOOLS = [
             },
         },
     },
-]
+)
@@ -1,11 +1,53 @@
 """Exchange rate API tool."""
 
-from typing import Dict, Optional
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+import orjson
 
 from core.config import settings
 from core.logger import logger
+from tools.http_client import close_http_client, request_with_retry, single_flight
+
+
+# 환율표 캐시 유지 시간 (초)
+_RATES_TTL = 3600
+
+# API 실패 시 사용하는 2024년 기준 대략적인 환율 (참고용)
+_BASE_FALLBACK_RATES = {
+    ("KRW", "JPY"): 0.11,      # 1 KRW = 0.11 JPY
+    ("KRW", "USD"): 0.00075,   # 1 KRW = 0.00075 USD
+    ("KRW", "EUR"): 0.00069,   # 1 KRW = 0.00069 EUR
+    ("KRW", "THB"): 0.027,     # 1 KRW = 0.027 THB
+    ("KRW", "CNY"): 0.0054,    # 1 KRW = 0.0054 CNY
+    ("JPY", "KRW"): 9.1,       # 1 JPY = 9.1 KRW
+    ("USD", "KRW"): 1330,      # 1 USD = 1330 KRW
+}
+
+
+def _build_fallback_rates(
+    base: Dict[Tuple[str, str], float],
+) -> Mapping[str, float]:
+    """직접 정의된 환율에 역방향 및 KRW 경유 환율을 채운 "FROM_TO" 키 테이블 생성."""
+    rates = {f"{a}_{b}": rate for (a, b), rate in base.items()}
+
+    # 역방향 (직접 정의된 값이 우선)
+    for (a, b), rate in base.items():
+        if rate > 0:
+            rates.setdefault(f"{b}_{a}", 1 / rate)
+
+    # KRW 경유 (예: JPY -> USD = JPY -> KRW -> USD)
+    currencies = {c for pair in base for c in pair} - {"KRW"}
+    for a in currencies:
+        for b in currencies:
+            if a != b:
+                rates.setdefault(f"{a}_{b}", rates[f"{a}_KRW"] * rates[f"KRW_{b}"])
+
+    return MappingProxyType(rates)
+
+
+_FALLBACK_RATES = _build_fallback_rates(_BASE_FALLBACK_RATES)
 
 
 class ExchangeTool:
@@ -14,14 +56,16 @@ class ExchangeTool:
     def __init__(self):
         """Initialize exchange tool."""
         self.base_url = settings.exchange_rate_base_url
+        # 기준 통화별 환율표 캐시 (실제로는 Redis 등 사용)
+        # 기준 통화 -> (조회 시각, {대상 통화: 환율})
+        self._cache: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        # 진행 중인 환율표 조회: 기준 통화 -> 결과 Future (완료되면 제거)
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
 
-    # 실시간 환율 데이터 캐시 (실제로는 Redis 등 사용)
-    _cache: Dict[str, Dict] = {}
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (앱 종료 시 호출)."""
+        await close_http_client()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-    )
     async def get_exchange_rate(
         self,
         from_currency: str = "KRW",
@@ -40,54 +84,90 @@ class ExchangeTool:
         from_currency = from_currency.upper()
         to_currency = to_currency.upper()
 
-        cache_key = f"{from_currency}_{to_currency}"
-
         # 캐시 확인
-        if cache_key in self._cache:
-            logger.debug(f"Exchange rate cache hit: {cache_key}")
-            return self._cache[cache_key]
+        rate = self._get_cached_rate(from_currency, to_currency)
+        if rate is not None:
+            logger.debug("Exchange rate cache hit: {}_{}", from_currency, to_currency)
+            return self._build_result(from_currency, to_currency, rate)
+
+        # 같은 기준 통화에 대한 동시 요청은 진행 중인 하나의 조회 결과(실패 포함)를 공유
+        rates = await single_flight(
+            self._inflight, from_currency, lambda: self._fetch_rates(from_currency),
+        )
+        if rates is None:
+            return self._get_fallback_rate(from_currency, to_currency)
+
+        if to_currency not in rates:
+            logger.warning(f"Currency not found: {to_currency}")
+            return self._get_fallback_rate(from_currency, to_currency)
+
+        rate = rates[to_currency]
+        self._store_inverse_rate(from_currency, to_currency, rate)
+        logger.info("Exchange rate: {} -> {} = {}", from_currency, to_currency, rate)
 
+        return self._build_result(from_currency, to_currency, rate)
+
+    def _get_cached_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """Return a cached rate if the base currency table is still fresh."""
+        entry = self._cache.get(from_currency)
+        if entry is None:
+            return None
+
+        fetched_at, rates = entry
+        if time.monotonic() - fetched_at > _RATES_TTL:
+            return None
+        return rates.get(to_currency)
+
+    async def _fetch_rates(self, from_currency: str) -> Optional[Dict[str, float]]:
+        """기준 통화의 전체 환율표를 조회하여 캐시에 저장."""
         try:
-            async with httpx.AsyncClient() as client:
-                # 무료 환율 API 사용
-                response = await client.get(
-                    f"{self.base_url}/latest/{from_currency}",
-                    timeout=10.0,
-                )
-
-                if response.status_code != 200:
-                    logger.warning(f"Exchange API error: {response.status_code}")
-                    return self._get_fallback_rate(from_currency, to_currency)
-
-                data = response.json()
-                rates = data.get("rates", {})
-
-                if to_currency not in rates:
-                    logger.warning(f"Currency not found: {to_currency}")
-                    return self._get_fallback_rate(from_currency, to_currency)
-
-                rate = rates[to_currency]
-                result = {
-                    "from_currency": from_currency,
-                    "to_currency": to_currency,
-                    "rate": rate,
-                    "inverse_rate": 1 / rate if rate > 0 else 0,
-                    "example": {
-                        "amount": 10000,
-                        "converted": round(10000 * rate, 2),
-                        "description": f"10,000 {from_currency} = {round(10000 * rate, 2)} {to_currency}",
-                    },
-                }
-
-                # 캐시 저장
-                self._cache[cache_key] = result
-                logger.info(f"Exchange rate: {from_currency} -> {to_currency} = {rate}")
-
-                return result
+            # 무료 환율 API 사용 - 한 번의 응답에 모든 통화가 포함됨
+            # 캐시 히트는 여기까지 오지 않으므로 재시도는 실제 HTTP 호출에만 적용
+            response = await request_with_retry(
+                "GET", f"{self.base_url}/latest/{from_currency}", "Exchange API",
+            )
+
+            if response.status_code != 200:
+                logger.warning(f"Exchange API error: {response.status_code}")
+                return None
+
+            rates = orjson.loads(response.content).get("rates", {})
+            self._cache[from_currency] = (time.monotonic(), rates)
+            return rates
 
         except Exception as e:
             logger.error(f"Exchange rate error: {e}")
-            return self._get_fallback_rate(from_currency, to_currency)
+            return None
+
+    def _store_inverse_rate(self, from_currency: str, to_currency: str, rate: float) -> None:
+        """역방향 환율을 대상 통화의 환율표에 채워 넣음."""
+        if rate <= 0 or self._get_cached_rate(to_currency, from_currency) is not None:
+            return
+
+        entry = self._cache.get(to_currency)
+        if entry is not None and time.monotonic() - entry[0] <= _RATES_TTL:
+            entry[1][from_currency] = 1 / rate
+        else:
+            self._cache[to_currency] = (time.monotonic(), {from_currency: 1 / rate})
+
+    def _build_result(
+        self,
+        from_currency: str,
+        to_currency: str,
+        rate: float,
+    ) -> Dict[str, any]:
+        """환율 조회 결과 생성."""
+        return {
+            "from_currency": from_currency,
+            "to_currency": to_currency,
+            "rate": rate,
+            "inverse_rate": 1 / rate if rate > 0 else 0,
+            "example": {
+                "amount": 10000,
+                "converted": round(10000 * rate, 2),
+                "description": f"10,000 {from_currency} = {round(10000 * rate, 2)} {to_currency}",
+            },
+        }
 
     def _get_fallback_rate(
         self,
@@ -98,21 +178,8 @@ class ExchangeTool:
         API 실패 시 대체 환율 데이터 반환.
         실제 환율과 다를 수 있음을 명시.
         """
-        # 2024년 기준 대략적인 환율 (참고용)
-        fallback_rates = {
-            ("KRW", "JPY"): 0.11,      # 1 KRW = 0.11 JPY
-            ("KRW", "USD"): 0.00075,   # 1 KRW = 0.00075 USD
-            ("KRW", "EUR"): 0.00069,   # 1 KRW = 0.00069 EUR
-            ("KRW", "THB"): 0.027,     # 1 KRW = 0.027 THB
-            ("KRW", "CNY"): 0.0054,    # 1 KRW = 0.0054 CNY
-            ("JPY", "KRW"): 9.1,       # 1 JPY = 9.1 KRW
-            ("USD", "KRW"): 1330,      # 1 USD = 1330 KRW
-        }
-
-        rate = fallback_rates.get(
-            (from_currency, to_currency),
-            1.0  # 알 수 없는 통화 쌍은 1:1
-        )
+        # 알 수 없는 통화 쌍은 1:1
+        rate = _FALLBACK_RATES.get(f"{from_currency}_{to_currency}", 1.0)
 
         return {
             "from_currency": from_currency,
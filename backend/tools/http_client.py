@@ -0,0 +1,112 @@
+"""Shared HTTP client and request helpers for the agent tools."""
+
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import httpx
+
+from core.logger import logger
+
+
+# HTTP 호출 최대 시도 횟수
+_MAX_ATTEMPTS = 3
+
+# 재시도할 가치가 있는 일시적 오류 상태 코드 (그 외 4xx는 재시도해도 결과가 같음)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 프로세스 전역에서 공유하는 HTTP 클라이언트 (keep-alive 커넥션 풀 재사용)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # 외부 API 호스트는 몇 개뿐이므로 HTTP/2 멀티플렉싱으로 소수의 커넥션을
+        # 오래 유지하여 TCP/TLS 핸드셰이크를 반복하지 않도록 함
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+            http2=True,
+            follow_redirects=False,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (앱 종료 시 호출, 여러 번 호출해도 안전)."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+async def request_with_retry(
+    method: str,
+    url: str,
+    api_name: str,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Send a request on the shared client, retrying transient failures.
+
+    Only transport errors and 429/5xx responses are retried, with
+    full-jitter backoff; the last response is returned as-is for the
+    caller to handle.
+
+    Args:
+        method: HTTP 메서드
+        url: 요청 URL
+        api_name: 재시도 로그에 표시할 API 이름
+        **kwargs: httpx.AsyncClient.request에 그대로 전달할 인자
+
+    Returns:
+        마지막 시도의 응답
+    """
+    client = get_http_client()
+    for attempt in range(_MAX_ATTEMPTS):
+        last_attempt = attempt == _MAX_ATTEMPTS - 1
+        try:
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in _RETRY_STATUSES or last_attempt:
+                return response
+            logger.warning(f"{api_name} retry attempt {attempt + 1}: HTTP {response.status_code}")
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            logger.warning(f"{api_name} retry attempt {attempt + 1}: {e}")
+        # full jitter: 동시에 실패한 요청들이 같은 시각에 몰려 재시도하지 않도록 분산
+        await asyncio.sleep(random.uniform(0, min(5, 2 ** attempt)))
+
+
+async def single_flight(
+    inflight: Dict[Hashable, "asyncio.Future[Any]"],
+    key: Hashable,
+    factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Run ``factory()`` once per key while it is in flight.
+
+    The work runs as its own task and every caller (including the first)
+    awaits it through ``asyncio.shield``, so cancelling one caller never
+    cancels the shared request for the other callers.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+
+        def _on_done(done: "asyncio.Future[Any]") -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+            # 모든 대기자가 취소된 경우 "exception was never retrieved" 경고가 나지 않도록 소비
+            if not done.cancelled():
+                done.exception()
+
+        task.add_done_callback(_on_done)
+
+    return await asyncio.shield(task)
@@ -1,12 +1,438 @@
 """Google Places API tool for location search."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import re
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+import diskcache
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import msgspec
+import orjson
 
 from core.config import settings
 from core.logger import logger
 from core.exceptions import ToolExecutionException
+from tools.http_client import close_http_client, request_with_retry, single_flight
+
+
+# Places API (New) searchText 응답에서 실제로 사용하는 필드만 요청
+_SEARCH_FIELD_MASK = ",".join([
+    "places.id",
+    "places.displayName",
+    "places.formattedAddress",
+    "places.location",
+    "places.rating",
+    "places.userRatingCount",
+    "places.types",
+    "places.priceLevel",
+    "places.currentOpeningHours.openNow",
+])
+
+# 배치 상세 조회 시 동시에 보내는 Place Details 요청 수
+_DETAILS_CONCURRENCY = 10
+
+# 지오코딩 결과 캐시 유지 시간 (도시 좌표는 거의 바뀌지 않음)
+_GEOCODE_TTL = 7 * 24 * 3600
+
+# 지오코딩 캐시 최대 항목 수 (초과 시 가장 오래 사용되지 않은 지역부터 제거)
+_GEOCODE_CACHE_SIZE = 4096
+
+# 프로세스 전역 지오코딩 캐시: 정규화된 지역명 -> (저장 시각, 좌표)
+_geocode_cache: "OrderedDict[str, Tuple[float, tuple]]" = OrderedDict()
+
+# 진행 중인 지오코딩 요청: 정규화된 지역명 -> 결과 Future
+_geocode_inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+# 재시작 후에도 유지되는 지오코딩 디스크 캐시 (메모리 LRU 아래 단계)
+_GEOCODE_DISK_TTL = 30 * 24 * 3600
+_GEOCODE_DISK_SIZE_LIMIT = 50_000_000
+_geocode_disk: Optional[diskcache.Cache] = None
+_geocode_disk_failed = False
+
+# 디스크 캐시 전용 스레드: diskcache의 SQLite 연결은 스레드마다 따로 열리므로
+# 모든 접근(열기/읽기/쓰기/닫기)을 한 스레드에서 처리해야 close()가 연결을 모두 닫음
+_geocode_disk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="geocode-disk")
+
+
+async def _run_on_disk_thread(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a disk cache operation on the dedicated disk thread (이벤트 루프를 막지 않음)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_geocode_disk_executor, func, *args)
+
+
+def _get_geocode_disk() -> Optional[diskcache.Cache]:
+    """
+    Get or open the on-disk geocode cache (None if it cannot be opened).
+
+    Opening creates the directory and SQLite schema, so this (like every
+    other disk cache call) runs on the disk thread, never on the event loop.
+    """
+    global _geocode_disk, _geocode_disk_failed
+    if _geocode_disk is None and not _geocode_disk_failed:
+        try:
+            _geocode_disk = diskcache.Cache(
+                str(Path(settings.cache_dir) / "geocode"),
+                size_limit=_GEOCODE_DISK_SIZE_LIMIT,
+            )
+        except Exception as e:
+            # 디스크 캐시 없이도 동작하도록 한 번 실패하면 다시 시도하지 않음
+            logger.warning(f"Geocode disk cache unavailable: {e}")
+            _geocode_disk_failed = True
+    return _geocode_disk
+
+
+def _close_geocode_disk() -> None:
+    """Close the disk cache if it was opened (디스크 스레드에서 실행)."""
+    global _geocode_disk
+    if _geocode_disk is not None:
+        _geocode_disk.close()
+    _geocode_disk = None
+
+
+def _load_disk_coords(key: str) -> Optional[tuple]:
+    """Read coordinates from the disk cache (디스크 스레드에서 실행)."""
+    disk = _get_geocode_disk()
+    return disk.get(key) if disk is not None else None
+
+
+def _store_disk_coords(key: str, coords: tuple) -> None:
+    """Write coordinates to the disk cache (디스크 스레드에서 실행)."""
+    disk = _get_geocode_disk()
+    if disk is not None:
+        disk.set(key, coords, expire=_GEOCODE_DISK_TTL)
+
+
+# API 키가 없을 때 사용하는 지역별 실제 장소 데이터
+_MOCK_PLACES_PATH = Path(__file__).parent / "data" / "mock_places.json"
+
+
+@lru_cache(maxsize=1)
+def _load_mock_places_db() -> Mapping[str, Mapping[str, List[Dict[str, Any]]]]:
+    """Load the mock places database (지역 -> 카테고리 -> 장소 목록)."""
+    db = orjson.loads(_MOCK_PLACES_PATH.read_bytes())
+    # 프로세스 전체가 공유하는 캐시된 객체이므로 읽기 전용으로 노출
+    return MappingProxyType({
+        city: MappingProxyType(categories) for city, categories in db.items()
+    })
+
+
+class _MockBucket(NamedTuple):
+    """(지역, 카테고리)별 mock 장소를 열 단위로 저장한 묶음."""
+
+    place_ids: Tuple[str, ...]
+    names: Tuple[str, ...]
+    addresses: Tuple[str, ...]
+    lats: Tuple[float, ...]
+    lngs: Tuple[float, ...]
+    ratings: Tuple[float, ...]
+
+
+@lru_cache(maxsize=1)
+def _mock_places_index() -> Dict[Tuple[str, str], _MockBucket]:
+    """
+    Flatten the mock database into (지역, 카테고리) -> _MockBucket, built once.
+
+    Each bucket is sorted by rating (highest first), so slicing the first
+    ``max_results`` entries already yields the top-rated places.
+    """
+    index = {}
+    for city, categories in _load_mock_places_db().items():
+        for category, places in categories.items():
+            # 평점이 같으면 원래 순서 유지 (sorted는 안정 정렬)
+            places = sorted(places, key=lambda p: p.get("rating", 4.3), reverse=True)
+            index[(city, category)] = _MockBucket(
+                # 같은 이름 앞부분이 다른 지역/카테고리에 있을 수 있으므로 둘 다 ID에 포함
+                place_ids=tuple(
+                    f"real_place_{city}_{category}_{i}_{p['name'][:10]}"
+                    for i, p in enumerate(places)
+                ),
+                names=tuple(p["name"] for p in places),
+                addresses=tuple(p["address"] for p in places),
+                lats=tuple(p["lat"] for p in places),
+                lngs=tuple(p["lng"] for p in places),
+                ratings=tuple(p.get("rating", 4.3) for p in places),
+            )
+    return index
+
+
+@lru_cache(maxsize=1)
+def _mock_places_by_id() -> Mapping[str, Tuple[str, str, float, float, float]]:
+    """Map mock place_id -> (이름, 주소, 위도, 경도, 평점) for mock detail lookups."""
+    by_id = {}
+    for bucket in _mock_places_index().values():
+        for row in zip(
+            bucket.place_ids, bucket.names, bucket.addresses,
+            bucket.lats, bucket.lngs, bucket.ratings,
+        ):
+            place_id, place = row[0], row[1:]
+            # ID가 겹치면 다른 장소의 정보를 반환하게 되므로 조용히 덮어쓰지 않음
+            if by_id.setdefault(place_id, place) != place:
+                raise ValueError(f"Duplicate mock place_id: {place_id}")
+    return MappingProxyType(by_id)
+
+
+@lru_cache(maxsize=1)
+def _mock_city_pattern() -> "re.Pattern[str]":
+    """Compile the mock database city names into one regex (긴 이름 우선)."""
+    cities = sorted(_load_mock_places_db(), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, cities)))
+
+
+# 도시 중심 좌표 (mock DB의 장소 좌표보다 우선), 알 수 없는 지역은 도쿄 좌표 사용
+_CITY_CENTER_COORDS = {
+    "오사카": (34.6937, 135.5023),
+    "도쿄": (35.6762, 139.6503),
+}
+_DEFAULT_CITY_COORDS = _CITY_CENTER_COORDS["도쿄"]
+
+
+@lru_cache(maxsize=1)
+def _mock_city_coords() -> Mapping[str, Tuple[float, float]]:
+    """
+    Map every mock database city to a representative (lat, lng), built once.
+
+    Cities without a hand-picked center use their first 관광지 (or, failing
+    that, first listed) place, so new cities in the JSON get coords for free.
+    """
+    coords = {}
+    for city, categories in _load_mock_places_db().items():
+        places = categories.get("관광지") or next(
+            (p for p in categories.values() if p), None
+        )
+        if places:
+            coords[city] = (places[0]["lat"], places[0]["lng"])
+    coords.update(_CITY_CENTER_COORDS)
+    return MappingProxyType(coords)
+
+
+# 검색어 키워드 -> mock 데이터 카테고리
+_QUERY_CATEGORIES = {
+    "맛집": ["맛집", "레스토랑", "현지 음식", "음식점", "식당"],
+    "관광지": ["관광지", "명소", "랜드마크", "볼거리"],
+    "포토스팟": ["포토스팟", "뷰포인트", "인스타그램", "사진", "촬영"],
+    "쇼핑": ["쇼핑", "시장", "백화점", "아울렛"],
+    "온천": ["온천", "스파", "휴식"],
+    "공원": ["공원", "정원"],
+    "액티비티": ["액티비티", "체험", "투어", "놀거리"],
+}
+
+_KEYWORD_TO_CATEGORY = {
+    keyword: category
+    for category, keywords in _QUERY_CATEGORIES.items()
+    for keyword in keywords
+}
+
+# 키워드가 모두 한글이면 대소문자가 없으므로 검색어를 소문자로 바꿀 필요가 없음
+_KEYWORDS_HAVE_CASE = any(kw.lower() != kw.upper() for kw in _KEYWORD_TO_CATEGORY)
+
+
+def _build_first_char_index(
+    keyword_to_category: Mapping[str, str],
+) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """키워드 첫 글자 -> (키워드, 카테고리) 목록 생성 (같은 위치에서 겹치면 긴 키워드 우선)."""
+    index: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for keyword, category in sorted(
+        keyword_to_category.items(), key=lambda kv: len(kv[0]), reverse=True,
+    ):
+        index[keyword[0]].append((keyword, category))
+    return {ch: tuple(entries) for ch, entries in index.items()}
+
+
+_BY_FIRST_CHAR = _build_first_char_index(_KEYWORD_TO_CATEGORY)
+
+
+def _match_query_category(query: str) -> Optional[str]:
+    """Return the category of the leftmost keyword in ``query`` (없으면 None)."""
+    if _KEYWORDS_HAVE_CASE:
+        query = query.lower()
+    # 검색어를 한 번만 훑으며 현재 글자로 시작하는 키워드만 확인
+    for i, ch in enumerate(query):
+        for keyword, category in _BY_FIRST_CHAR.get(ch, ()):
+            if query.startswith(keyword, i):
+                return category
+    return None
+
+
+def _resolve_mock_bucket(query: str, location: str) -> Tuple[str, Optional[str]]:
+    """Resolve a mock search to (지역, 카테고리); 카테고리는 없으면 None."""
+    real_places_db = _load_mock_places_db()
+
+    # 쿼리 키워드 정규화 - 다양한 검색어를 카테고리에 매핑
+    query_normalized = _match_query_category(query) or query
+
+    # 해당 지역 찾기 (없으면 기본 지역으로 오사카 사용)
+    city_match = _mock_city_pattern().search(location)
+    city = city_match.group(0) if city_match else "오사카"
+    categories = real_places_db.get(city, {})
+
+    # 해당 카테고리의 장소 찾기
+    if categories.get(query_normalized):
+        return city, query_normalized
+
+    # 해당 카테고리가 없으면 유사 카테고리 시도
+    for cat in categories:
+        if query_normalized.lower() in cat.lower() or cat.lower() in query_normalized.lower():
+            return city, cat
+
+    # 여전히 없으면 맛집 또는 관광지 기본값 사용
+    for cat in ("맛집", "관광지"):
+        if cat in categories:
+            return city, cat
+    return city, None
+
+
+@lru_cache(maxsize=512)
+def _format_mock_places(
+    city: str,
+    category: Optional[str],
+    max_results: int,
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    Format the first ``max_results`` mock places of a (지역, 카테고리) bucket.
+
+    The result is cached and shared, so callers must copy before handing it out.
+    """
+    bucket = _mock_places_index().get((city, category))
+    if bucket is None:
+        return ()
+
+    return tuple(
+        {
+            "place_id": bucket.place_ids[i],
+            "name": bucket.names[i],
+            "address": bucket.addresses[i],
+            "location": {
+                "lat": bucket.lats[i],
+                "lng": bucket.lngs[i],
+            },
+            "rating": bucket.ratings[i],
+            "user_ratings_total": 300 + (i * 50),
+            "types": ("establishment",),
+            "price_level": min(i + 1, 4),
+            "open_now": True,
+        }
+        for i in range(min(max_results, len(bucket.names)))
+    )
+
+
+# 캐시 키에서만 제거하는 공백/구두점 (API에는 원래 지역명을 그대로 전달)
+_LOCATION_KEY_STRIP = str.maketrans("", "", " \t\u3000,.-")
+
+# 영문 지역명 -> 한글 지역명 (같은 도시가 하나의 캐시 항목을 쓰도록)
+_LOCATION_ALIASES = {
+    "osaka": "오사카",
+    "tokyo": "도쿄",
+    "kyoto": "교토",
+    "jeju": "제주",
+    "jejudo": "제주도",
+    "busan": "부산",
+    "seoul": "서울",
+    "bangkok": "방콕",
+    "paris": "파리",
+}
+
+
+def _location_key(location: str) -> str:
+    """Normalize a location name for cache lookups."""
+    key = location.strip().casefold().translate(_LOCATION_KEY_STRIP)
+    return _LOCATION_ALIASES.get(key, key)
+
+
+# Place Details 응답 매핑에서 실제로 읽는 필드만 요청 (photos 등은 받지 않음)
+_DETAILS_FIELDS = (
+    "name,formatted_address,geometry/location,rating,user_ratings_total,"
+    "opening_hours,price_level,website,formatted_phone_number,reviews,types"
+)
+
+# search_places 결과에 포함되는 필드 (이 범위의 필드만 필요하면 Details 호출 생략)
+_SEARCH_RESULT_FIELDS = frozenset({
+    "place_id",
+    "name",
+    "address",
+    "location",
+    "rating",
+    "user_ratings_total",
+    "types",
+    "price_level",
+    "open_now",
+})
+
+# Places API (New) priceLevel → 기존 0~4 정수 표현
+_PRICE_LEVELS = {
+    "PRICE_LEVEL_FREE": 0,
+    "PRICE_LEVEL_INEXPENSIVE": 1,
+    "PRICE_LEVEL_MODERATE": 2,
+    "PRICE_LEVEL_EXPENSIVE": 3,
+    "PRICE_LEVEL_VERY_EXPENSIVE": 4,
+}
+
+
+# Mock 장소 상세 정보의 고정 필드 (호출마다 새로 만들지 않고 공유, 리스트 대신 tuple 사용)
+_MOCK_DETAIL_TEMPLATE: Dict[str, Any] = {
+    "rating": 4.3,
+    "user_ratings_total": 350,
+    "price_level": 2,
+    "opening_hours": ("월-금: 10:00-22:00", "토-일: 11:00-21:00"),
+    "website": None,
+    "phone": None,
+    "types": ("establishment",),
+    "reviews": (
+        {"rating": 5, "text": "정말 좋았어요!", "time": "일주일 전"},
+        {"rating": 4, "text": "분위기가 좋습니다", "time": "한달 전"},
+    ),
+}
+
+
+class _LatLng(msgspec.Struct, frozen=True):
+    latitude: float
+    longitude: float
+
+
+class _LocalizedText(msgspec.Struct, frozen=True):
+    text: Optional[str] = None
+
+
+class _OpeningHours(msgspec.Struct, frozen=True, rename="camel"):
+    open_now: Optional[bool] = None
+
+
+class _Place(msgspec.Struct, rename="camel"):
+    """searchText 응답의 장소 (FieldMask로 요청한 필드만 정의)."""
+
+    location: _LatLng
+    id: Optional[str] = None
+    display_name: _LocalizedText = _LocalizedText()
+    formatted_address: Optional[str] = None
+    rating: Optional[float] = None
+    user_rating_count: Optional[int] = None
+    types: List[str] = []
+    price_level: Optional[str] = None
+    current_opening_hours: _OpeningHours = _OpeningHours()
+
+
+class _SearchTextResponse(msgspec.Struct):
+    places: List[_Place] = []
+
+
+# searchText 응답을 중간 dict 없이 바로 구조체로 디코딩
+_search_decoder = msgspec.json.Decoder(_SearchTextResponse)
 
 
 class PlacesTool:
@@ -15,28 +441,105 @@ class PlacesTool:
     def __init__(self):
         """Initialize Places tool."""
         self.api_key = settings.google_places_api_key
+        # 설정은 런타임에 바뀌지 않으므로 한 번만 판단
+        self._available = bool(self.api_key)
         self.base_url = "https://maps.googleapis.com/maps/api/place"
-        self._geocode_cache: Dict[str, tuple] = {}
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self.search_text_url = "https://places.googleapis.com/v1/places:searchText"
+        self.geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
+        self.details_url = f"{self.base_url}/details/json"
+        # 요청마다 바뀌지 않는 파라미터/헤더는 한 번만 생성
+        self._base_params = {"key": self.api_key, "language": "ko"}
+        self._details_params = {**self._base_params, "fields": _DETAILS_FIELDS}
+        self._search_headers = {
+            "X-Goog-Api-Key": self.api_key,
+            "X-Goog-FieldMask": _SEARCH_FIELD_MASK,
+        }
+        self._details_semaphore = asyncio.Semaphore(_DETAILS_CONCURRENCY)
+        # 진행 중인 검색/상세 조회: 요청 인자 -> 결과 Future
+        self._search_inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._details_inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        # 결과를 기다리지 않고 실행 중인 지오코딩 태스크
+        self._background_tasks: Set["asyncio.Future[Any]"] = set()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and disk cache (앱 종료 시 호출)."""
+        await close_http_client()
+        await _run_on_disk_thread(_close_geocode_disk)
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send an HTTP request, retrying transient failures with jittered backoff.
+
+        Only transport errors and 429/5xx responses are retried; the last
+        response is returned as-is for the caller to handle. Mock 데이터나
+        캐시 히트 경로는 이 메서드를 거치지 않으므로 재시도 비용은 실제 API
+        호출에만 발생합니다.
+        """
+        return await request_with_retry(method, url, "Places API", **kwargs)
+
+    def _get_cached_coords(self, key: str) -> Optional[tuple]:
+        """Return cached coordinates if present and not expired."""
+        entry = _geocode_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, coords = entry
+        if time.monotonic() - stored_at > _GEOCODE_TTL:
+            del _geocode_cache[key]
+            return None
 
-    def _get_client(self) -> httpx.AsyncClient:
-        """Get or create reusable HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=10.0)
-        return self._http_client
+        _geocode_cache.move_to_end(key)
+        return coords
 
     async def _geocode(self, location: str) -> Optional[tuple]:
         """Geocode a location with caching."""
-        if location in self._geocode_cache:
-            return self._geocode_cache[location]
-
-        geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-        client = self._get_client()
-        geo_response = await client.get(
-            geocode_url,
-            params={"address": location, "key": self.api_key, "language": "ko"},
+        key = _location_key(location)
+
+        coords = self._get_cached_coords(key)
+        if coords:
+            return coords
+
+        async def fetch_and_store() -> Optional[tuple]:
+            # SQLite I/O가 이벤트 루프를 막지 않도록 디스크 캐시는 전용 스레드에서 접근
+            coords = await _run_on_disk_thread(_load_disk_coords, key)
+            if coords is None:
+                coords = await self._fetch_geocode(location)
+                if coords:
+                    await _run_on_disk_thread(_store_disk_coords, key, coords)
+
+            if coords:
+                _geocode_cache[key] = (time.monotonic(), coords)
+                _geocode_cache.move_to_end(key)
+                while len(_geocode_cache) > _GEOCODE_CACHE_SIZE:
+                    _geocode_cache.popitem(last=False)
+            return coords
+
+        # 같은 지역에 대한 동시 요청은 진행 중인 하나의 API 호출 결과를 공유
+        return await single_flight(_geocode_inflight, key, fetch_and_store)
+
+    def _geocode_in_background(self, location: str) -> None:
+        """Warm the geocode cache without making the caller wait for it."""
+        task = asyncio.ensure_future(self._geocode(location))
+        # 이벤트 루프는 태스크를 약한 참조로만 보관하므로 완료될 때까지 참조 유지
+        self._background_tasks.add(task)
+
+        def _on_done(done: "asyncio.Future[Any]") -> None:
+            self._background_tasks.discard(done)
+            if done.cancelled():
+                return
+            if done.exception() is not None or not done.result():
+                logger.warning(f"Geocoding failed for: {location}, searching by text only")
+
+        task.add_done_callback(_on_done)
+
+    async def _fetch_geocode(self, location: str) -> Optional[tuple]:
+        """Call the Geocoding API, falling back to known city coordinates."""
+        geo_response = await self._request(
+            "GET",
+            self.geocode_url,
+            params={**self._base_params, "address": location},
         )
-        geo_data = geo_response.json()
+        geo_data = orjson.loads(geo_response.content)
 
         if geo_data.get("status") != "OK" or not geo_data.get("results"):
             # 한국 주요 도시 좌표 폴백
@@ -55,23 +558,17 @@ class PlacesTool:
             for name, coords in fallback_coords.items():
                 if name in location:
                     logger.info(f"Using fallback coordinates for: {location}")
-                    self._geocode_cache[location] = coords
                     return coords
             return None
 
         lat = geo_data["results"][0]["geometry"]["location"]["lat"]
         lng = geo_data["results"][0]["geometry"]["location"]["lng"]
-        self._geocode_cache[location] = (lat, lng)
         return (lat, lng)
 
     def is_available(self) -> bool:
         """Check if tool is available."""
-        return bool(self.api_key)
+        return self._available
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-    )
     async def search_places(
         self,
         query: str,
@@ -93,73 +590,104 @@ class PlacesTool:
         Returns:
             검색된 장소 목록
         """
-        if not self.is_available():
+        if not self._available:
             logger.warning("Places API not configured, using mock data")
             return self._get_mock_places(query, location, max_results)
 
-        try:
-            # 먼저 지역의 좌표를 가져옴 (캐시 활용)
-            coords = await self._geocode(location)
-            if not coords:
-                logger.warning(f"Geocoding failed for: {location}")
-                return self._get_mock_places(query, location, max_results)
+        # 같은 인자로 동시에 들어온 검색은 하나의 API 호출 결과를 공유
+        results = await single_flight(
+            self._search_inflight,
+            (query, location, place_type, max_results, radius_km),
+            lambda: self._search_places(query, location, place_type, max_results, radius_km),
+        )
+        # 목록만 복사 (장소 dict는 같은 요청의 호출자끼리 공유하므로 읽기 전용으로 사용)
+        return list(results)
 
-            lat, lng = coords
-            client = self._get_client()
-
-            # Text Search API 호출
-            search_url = f"{self.base_url}/textsearch/json"
-            params = {
-                "query": f"{query} in {location}",
-                "location": f"{lat},{lng}",
-                "radius": int(radius_km * 1000),
-                "key": self.api_key,
-                "language": "ko",
+    async def _search_places(
+        self,
+        query: str,
+        location: str,
+        place_type: Optional[str],
+        max_results: int,
+        radius_km: float,
+    ) -> List[Dict[str, Any]]:
+        """Run a single searchText request (mock data on failure)."""
+        try:
+            body: Dict[str, Any] = {
+                "textQuery": f"{query} in {location}",
+                "languageCode": "ko",
+                "maxResultCount": min(max_results, 20),
             }
 
+            # 캐시된 좌표가 있을 때만 반경으로 결과를 보정
+            coords = self._get_cached_coords(_location_key(location))
+            if coords:
+                lat, lng = coords
+                body["locationBias"] = {
+                    "circle": {
+                        "center": {"latitude": lat, "longitude": lng},
+                        "radius": min(radius_km * 1000, 50000.0),
+                    },
+                }
+
             if place_type:
-                params["type"] = place_type
+                body["includedType"] = place_type
+
+            # Text Search (New) API 호출 - FieldMask로 필요한 필드만 수신
+            search = self._request(
+                "POST",
+                self.search_text_url,
+                json=body,
+                headers=self._search_headers,
+            )
+
+            if not coords:
+                # 좌표 캐시 미스: textQuery에 지역명이 포함되어 있으므로 검색 결과는
+                # 지오코딩을 기다리지 않고 사용하고, 좌표는 다음 호출을 위해 백그라운드에서 캐시
+                self._geocode_in_background(location)
 
-            response = await client.get(search_url, params=params)
-            data = response.json()
+            response = await search
 
-            if data.get("status") != "OK":
-                logger.warning(f"Places search failed: {data.get('status')}")
+            if response.status_code != 200:
+                logger.warning(f"Places search failed: {response.status_code}")
                 return self._get_mock_places(query, location, max_results)
 
-            results = []
-            for place in data.get("results", [])[:max_results]:
-                results.append({
-                    "place_id": place.get("place_id"),
-                    "name": place.get("name"),
-                    "address": place.get("formatted_address"),
+            places = _search_decoder.decode(response.content).places
+            if not places:
+                logger.warning(f"No places found for '{query}' in {location}")
+                return self._get_mock_places(query, location, max_results)
+
+            results = [
+                {
+                    "place_id": place.id,
+                    "name": place.display_name.text,
+                    "address": place.formatted_address,
                     "location": {
-                        "lat": place["geometry"]["location"]["lat"],
-                        "lng": place["geometry"]["location"]["lng"],
+                        "lat": place.location.latitude,
+                        "lng": place.location.longitude,
                     },
-                    "rating": place.get("rating"),
-                    "user_ratings_total": place.get("user_ratings_total"),
-                    "types": place.get("types", []),
-                    "price_level": place.get("price_level"),
-                    "open_now": place.get("opening_hours", {}).get("open_now"),
-                })
-
-            logger.info(f"Found {len(results)} places for '{query}' in {location}")
+                    "rating": place.rating,
+                    "user_ratings_total": place.user_rating_count,
+                    "types": place.types,
+                    "price_level": _PRICE_LEVELS.get(place.price_level),
+                    "open_now": place.current_opening_hours.open_now,
+                }
+                for place in places[:max_results]
+            ]
+
+            logger.info("Found {} places for '{}' in {}", len(results), query, location)
             return results
 
         except Exception as e:
             logger.error(f"Places search error: {e}")
             return self._get_mock_places(query, location, max_results)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-    )
     async def get_place_details(
         self,
         place_name: str,
         location: str,
         place_id: Optional[str] = None,
+        fields: Optional[AbstractSet[str]] = None,
     ) -> Dict[str, Any]:
         """
         장소 상세 정보를 조회합니다.
@@ -168,11 +696,13 @@ class PlacesTool:
             place_name: 장소명
             location: 지역
             place_id: Google Places ID (있으면 사용)
+            fields: 필요한 필드 (None이면 전체). place_id 없이 호출했고 검색
+                결과 필드만으로 충분하면 Details API를 호출하지 않음
 
         Returns:
             장소 상세 정보
         """
-        if not self.is_available():
+        if not self._available:
             logger.warning("Places API not configured, using mock data")
             return self._get_mock_place_details(place_name, location)
 
@@ -181,60 +711,109 @@ class PlacesTool:
             if not place_id:
                 places = await self.search_places(place_name, location, max_results=1)
                 if places:
+                    # 영업시간/웹사이트/전화/리뷰가 필요 없으면 검색 결과로 충분
+                    if fields is not None and fields <= _SEARCH_RESULT_FIELDS:
+                        return places[0]
                     place_id = places[0].get("place_id")
 
             if not place_id:
                 return self._get_mock_place_details(place_name, location)
 
-            client = self._get_client()
-
-            # Place Details API 호출
-            details_url = f"{self.base_url}/details/json"
-            params = {
-                "place_id": place_id,
-                "key": self.api_key,
-                "language": "ko",
-                "fields": "name,formatted_address,geometry,rating,user_ratings_total,"
-                         "opening_hours,price_level,website,formatted_phone_number,"
-                         "reviews,types,photos",
-            }
-
-            response = await client.get(details_url, params=params)
-            data = response.json()
-
-            if data.get("status") != "OK":
+            details = await self._fetch_details(place_id)
+            if details is None:
                 return self._get_mock_place_details(place_name, location)
-
-            result = data.get("result", {})
-            return {
-                "place_id": place_id,
-                "name": result.get("name"),
-                "address": result.get("formatted_address"),
-                "location": {
-                    "lat": result.get("geometry", {}).get("location", {}).get("lat"),
-                    "lng": result.get("geometry", {}).get("location", {}).get("lng"),
-                },
-                "rating": result.get("rating"),
-                "user_ratings_total": result.get("user_ratings_total"),
-                "price_level": result.get("price_level"),
-                "opening_hours": result.get("opening_hours", {}).get("weekday_text", []),
-                "website": result.get("website"),
-                "phone": result.get("formatted_phone_number"),
-                "types": result.get("types", []),
-                "reviews": [
-                    {
-                        "rating": r.get("rating"),
-                        "text": r.get("text"),
-                        "time": r.get("relative_time_description"),
-                    }
-                    for r in result.get("reviews", [])[:3]
-                ],
-            }
+            return details
 
         except Exception as e:
             logger.error(f"Place details error: {e}")
             return self._get_mock_place_details(place_name, location)
 
+    async def _fetch_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch details for a place_id, sharing in-flight requests for the same id."""
+        return await single_flight(
+            self._details_inflight, place_id, lambda: self._request_details(place_id),
+        )
+
+    async def _request_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """Call the Place Details API for a single place_id (None if not OK)."""
+        params = {**self._details_params, "place_id": place_id}
+
+        # 배치 조회 시 Google 쪽 동시 요청 수 제한
+        async with self._details_semaphore:
+            response = await self._request("GET", self.details_url, params=params)
+        data = orjson.loads(response.content)
+
+        if data.get("status") != "OK":
+            return None
+
+        result = data.get("result", {})
+        return {
+            "place_id": place_id,
+            "name": result.get("name"),
+            "address": result.get("formatted_address"),
+            "location": {
+                "lat": result.get("geometry", {}).get("location", {}).get("lat"),
+                "lng": result.get("geometry", {}).get("location", {}).get("lng"),
+            },
+            "rating": result.get("rating"),
+            "user_ratings_total": result.get("user_ratings_total"),
+            "price_level": result.get("price_level"),
+            "opening_hours": result.get("opening_hours", {}).get("weekday_text", []),
+            "website": result.get("website"),
+            "phone": result.get("formatted_phone_number"),
+            "types": result.get("types", []),
+            "reviews": [
+                {
+                    "rating": r.get("rating"),
+                    "text": r.get("text"),
+                    "time": r.get("relative_time_description"),
+                }
+                for r in result.get("reviews", [])[:3]
+            ],
+        }
+
+    async def get_place_details_batch(
+        self,
+        place_ids: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 장소의 상세 정보를 place_id로 동시에 조회합니다.
+
+        search_places 결과의 place_id를 그대로 넘기면 됩니다. 중복된 place_id는
+        한 번만 조회하고, 동시 요청 수는 세마포어로 제한합니다. 조회에 실패한
+        항목은 {"place_id", "error"} 형태로 반환합니다.
+
+        Args:
+            place_ids: Google Places ID 목록 (API 미설정 시에는 Mock 검색 결과의 ID)
+
+        Returns:
+            입력 순서와 같은 순서의 장소 상세 정보 목록
+        """
+        unique_ids = list(dict.fromkeys(place_ids))
+
+        if not self._available:
+            logger.warning("Places API not configured, using mock data")
+            by_id = {pid: self._get_mock_place_details_by_id(pid) for pid in unique_ids}
+            return [by_id[pid] for pid in place_ids]
+
+        fetched = await asyncio.gather(
+            *(self._fetch_details(pid) for pid in unique_ids),
+            return_exceptions=True,
+        )
+
+        # 항목별로 실패를 처리하여 하나의 오류가 전체 배치를 깨지 않도록 함
+        # (실제 장소 ID에 Mock 데이터를 붙이지 않고 오류를 그대로 알림)
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for pid, details in zip(unique_ids, fetched):
+            if isinstance(details, Exception):
+                logger.error(f"Place details error: {pid} - {details}")
+                details = {"place_id": pid, "error": str(details)}
+            elif details is None:
+                details = {"place_id": pid, "error": "Place details not found"}
+            by_id[pid] = details
+
+        return [by_id[pid] for pid in place_ids]
+
     def _get_mock_places(
         self,
         query: str,
@@ -242,384 +821,44 @@ class PlacesTool:
         max_results: int,
     ) -> List[Dict[str, Any]]:
         """Mock 장소 데이터 생성 - 실제 장소명 사용."""
-        # 지역별 실제 장소 데이터베이스
-        real_places_db = {
-            "오사카": {
-                "맛집": [
-                    {"name": "이치란 라멘 도톤보리점", "address": "오사카시 중앙구 도톤보리 1-4-16", "lat": 34.6687, "lng": 135.5013, "rating": 4.4},
-                    {"name": "쿠라스시 도톤보리점", "address": "오사카시 중앙구 도톤보리 1-8-22", "lat": 34.6690, "lng": 135.5025, "rating": 4.3},
-                    {"name": "치보 본점", "address": "오사카시 중앙구 도톤보리 1-5-5", "lat": 34.6685, "lng": 135.5013, "rating": 4.2},
-                    {"name": "다루마 신세카이 본점", "address": "오사카시 나니와구 에비스히가시 3-3-4", "lat": 34.6522, "lng": 135.5059, "rating": 4.5},
-                    {"name": "아지노야 본점", "address": "오사카시 나니와구 에비스히가시 1-18-18", "lat": 34.6525, "lng": 135.5065, "rating": 4.3},
-                ],
-                "레스토랑": [
-                    {"name": "키지 우메다 본점", "address": "오사카시 키타구 카쿠다초", "lat": 34.7048, "lng": 135.4948, "rating": 4.4},
-                    {"name": "칸자키 갓텐 스시", "address": "오사카시 키타구 우메다 1-3", "lat": 34.6977, "lng": 135.4912, "rating": 4.5},
-                    {"name": "마츠리야 우메다점", "address": "오사카시 키타구 우메다 1-9", "lat": 34.7005, "lng": 135.4973, "rating": 4.2},
-                    {"name": "하루카스 다이닝", "address": "오사카시 아베노구 아베노스지 1-1-43", "lat": 34.6463, "lng": 135.5138, "rating": 4.3},
-                    {"name": "마루카메 제면 난바점", "address": "오사카시 중앙구 난바 3-6-14", "lat": 34.6654, "lng": 135.5014, "rating": 4.1},
-                ],
-                "현지 음식": [
-                    {"name": "구로몬 시장", "address": "오사카시 중앙구 닛폰바시 2-4-1", "lat": 34.6668, "lng": 135.5069, "rating": 4.4},
-                    {"name": "신세카이 쟝쟝요코초", "address": "오사카시 나니와구 에비스히가시 3", "lat": 34.6520, "lng": 135.5060, "rating": 4.3},
-                    {"name": "도톤보리 타코야키 골목", "address": "오사카시 중앙구 도톤보리 1-9", "lat": 34.6688, "lng": 135.5015, "rating": 4.2},
-                    {"name": "텐진바시스지 상점가", "address": "오사카시 키타구 텐진바시 4-9", "lat": 34.7065, "lng": 135.5112, "rating": 4.1},
-                    {"name": "호젠지 요코초", "address": "오사카시 중앙구 난바 1-2", "lat": 34.6692, "lng": 135.5025, "rating": 4.4},
-                ],
-                "관광지": [
-                    {"name": "오사카성 천수각", "address": "오사카시 중앙구 오사카조 1-1", "lat": 34.6873, "lng": 135.5262, "rating": 4.6},
-                    {"name": "도톤보리 글리코상", "address": "오사카시 중앙구 도톤보리 1", "lat": 34.6687, "lng": 135.5010, "rating": 4.5},
-                    {"name": "츠텐카쿠 전망대", "address": "오사카시 나니와구 에비스히가시 1-18-6", "lat": 34.6525, "lng": 135.5063, "rating": 4.3},
-                    {"name": "우메다 스카이빌딩 공중정원", "address": "오사카시 키타구 오요도나카 1-1-88", "lat": 34.7052, "lng": 135.4906, "rating": 4.5},
-                    {"name": "시텐노지", "address": "오사카시 텐노지구 시텐노지 1-11-18", "lat": 34.6533, "lng": 135.5167, "rating": 4.4},
-                ],
-                "명소": [
-                    {"name": "신사이바시스지 상점가", "address": "오사카시 중앙구 신사이바시스지", "lat": 34.6720, "lng": 135.5010, "rating": 4.3},
-                    {"name": "난바 파크스", "address": "오사카시 나니와구 난바나카 2-10-70", "lat": 34.6612, "lng": 135.5030, "rating": 4.4},
-                    {"name": "덴포잔 대관람차", "address": "오사카시 미나토구 가이간도리 1-1-10", "lat": 34.6544, "lng": 135.4298, "rating": 4.2},
-                    {"name": "아베노 하루카스", "address": "오사카시 아베노구 아베노스지 1-1-43", "lat": 34.6463, "lng": 135.5138, "rating": 4.5},
-                    {"name": "스미요시타이샤", "address": "오사카시 스미요시구 스미요시 2-9-89", "lat": 34.6127, "lng": 135.4928, "rating": 4.5},
-                ],
-                "랜드마크": [
-                    {"name": "통천각", "address": "오사카시 나니와구 에비스히가시 1-18-6", "lat": 34.6525, "lng": 135.5063, "rating": 4.3},
-                    {"name": "오사카 해유관", "address": "오사카시 미나토구 가이간도리 1-1-10", "lat": 34.6545, "lng": 135.4287, "rating": 4.6},
-                    {"name": "그랜프론트 오사카", "address": "오사카시 키타구 오후카초 4-1", "lat": 34.7055, "lng": 135.4945, "rating": 4.3},
-                    {"name": "난바 그랜드 카이칸", "address": "오사카시 나니와구 난바센니치마에", "lat": 34.6603, "lng": 135.5015, "rating": 4.1},
-                    {"name": "오사카역 시티", "address": "오사카시 키타구 우메다 3-1-3", "lat": 34.7024, "lng": 135.4959, "rating": 4.4},
-                ],
-                "포토스팟": [
-                    {"name": "도톤보리 글리코상 포토존", "address": "오사카시 중앙구 도톤보리", "lat": 34.6687, "lng": 135.5010, "rating": 4.5},
-                    {"name": "우메다 스카이빌딩 전망대", "address": "오사카시 키타구 오요도나카 1-1-88", "lat": 34.7052, "lng": 135.4906, "rating": 4.5},
-                    {"name": "오사카성 니시노마루 정원", "address": "오사카시 중앙구 오사카조 2", "lat": 34.6867, "lng": 135.5230, "rating": 4.4},
-                    {"name": "에비스바시", "address": "오사카시 중앙구 에비스바시", "lat": 34.6690, "lng": 135.5015, "rating": 4.3},
-                    {"name": "나카노시마 공원", "address": "오사카시 키타구 나카노시마 1", "lat": 34.6915, "lng": 135.5030, "rating": 4.4},
-                ],
-                "뷰포인트": [
-                    {"name": "하루카스 300 전망대", "address": "오사카시 아베노구 아베노스지 1-1-43", "lat": 34.6463, "lng": 135.5138, "rating": 4.5},
-                    {"name": "덴포잔 대관람차", "address": "오사카시 미나토구 가이간도리 1-1-10", "lat": 34.6544, "lng": 135.4298, "rating": 4.2},
-                    {"name": "사카이스지혼마치 빌딩 전망층", "address": "오사카시 중앙구 혼마치 4-1-3", "lat": 34.6820, "lng": 135.5045, "rating": 4.0},
-                    {"name": "WTC 코스모타워 전망대", "address": "오사카시 스미노에구 난코키타 1-14-16", "lat": 34.6407, "lng": 135.4129, "rating": 4.3},
-                    {"name": "시텐노지 혼보 정원", "address": "오사카시 텐노지구 시텐노지 1-11-18", "lat": 34.6533, "lng": 135.5167, "rating": 4.2},
-                ],
-                "인스타그램": [
-                    {"name": "teamLab Botanical Garden Osaka", "address": "오사카시 츠루미구 료쿠치공원 2-163", "lat": 34.7165, "lng": 135.5770, "rating": 4.6},
-                    {"name": "난바 파크스 가든", "address": "오사카시 나니와구 난바나카 2-10-70", "lat": 34.6612, "lng": 135.5030, "rating": 4.4},
-                    {"name": "신세카이 네온거리", "address": "오사카시 나니와구 에비스히가시 2", "lat": 34.6522, "lng": 135.5060, "rating": 4.3},
-                    {"name": "아메리카무라", "address": "오사카시 중앙구 니시신사이바시 1-7", "lat": 34.6720, "lng": 135.4980, "rating": 4.2},
-                    {"name": "호젠지 요코초 골목", "address": "오사카시 중앙구 난바 1-2-16", "lat": 34.6692, "lng": 135.5025, "rating": 4.4},
-                ],
-                "쇼핑": [
-                    {"name": "신사이바시스지 상점가", "address": "오사카시 중앙구 신사이바시스지 2", "lat": 34.6720, "lng": 135.5010, "rating": 4.3},
-                    {"name": "돈키호테 도톤보리점", "address": "오사카시 중앙구 소에몬쵸 7-23", "lat": 34.6693, "lng": 135.5035, "rating": 4.2},
-                    {"name": "다이마루 우메다점", "address": "오사카시 키타구 우메다 3-1-1", "lat": 34.7012, "lng": 135.4962, "rating": 4.3},
-                    {"name": "BIC카메라 난바점", "address": "오사카시 중앙구 센니치마에 2-10-1", "lat": 34.6643, "lng": 135.5012, "rating": 4.1},
-                    {"name": "링쿠 프리미엄 아울렛", "address": "이즈미사노시 린쿠오라이미나미 3-28", "lat": 34.4262, "lng": 135.2981, "rating": 4.4},
-                ],
-                "시장": [
-                    {"name": "구로몬 시장", "address": "오사카시 중앙구 닛폰바시 2-4-1", "lat": 34.6668, "lng": 135.5069, "rating": 4.4},
-                    {"name": "텐진바시스지 상점가", "address": "오사카시 키타구 텐진바시 4-9", "lat": 34.7065, "lng": 135.5112, "rating": 4.1},
-                    {"name": "센니치마에 도구야스지", "address": "오사카시 중앙구 센니치마에 2", "lat": 34.6650, "lng": 135.5050, "rating": 4.0},
-                    {"name": "키레이 상점가", "address": "오사카시 텐노지구 키레 2", "lat": 34.6345, "lng": 135.5225, "rating": 4.0},
-                    {"name": "츠루하시 코리아타운", "address": "오사카시 이쿠노구 모모다니 2", "lat": 34.6623, "lng": 135.5330, "rating": 4.2},
-                ],
-                "백화점": [
-                    {"name": "한큐 우메다 본점", "address": "오사카시 키타구 카쿠다초 8-7", "lat": 34.7047, "lng": 135.4987, "rating": 4.4},
-                    {"name": "다카시마야 오사카점", "address": "오사카시 중앙구 난바 5-1-5", "lat": 34.6653, "lng": 135.5013, "rating": 4.3},
-                    {"name": "긴테츠 백화점 아베노 하루카스점", "address": "오사카시 아베노구 아베노스지 1-1-43", "lat": 34.6463, "lng": 135.5138, "rating": 4.5},
-                    {"name": "오사카 타카시마야", "address": "오사카시 중앙구 난바 5-1-5", "lat": 34.6653, "lng": 135.5013, "rating": 4.3},
-                    {"name": "한신 백화점 우메다 본점", "address": "오사카시 키타구 우메다 1-13-13", "lat": 34.7005, "lng": 135.4985, "rating": 4.2},
-                ],
-                "온천": [
-                    {"name": "스파월드", "address": "오사카시 나니와구 에비스히가시 3-4-24", "lat": 34.6510, "lng": 135.5065, "rating": 4.3},
-                    {"name": "소라니와 온천", "address": "오사카시 키타구 오요도나카 1-1-88", "lat": 34.7052, "lng": 135.4906, "rating": 4.2},
-                    {"name": "난바 온천", "address": "오사카시 나니와구 난바나카 1-10-8", "lat": 34.6620, "lng": 135.5010, "rating": 4.0},
-                    {"name": "텐넨온천 나니와노유", "address": "오사카시 키타구 나카쓰 1-5-18", "lat": 34.7118, "lng": 135.5002, "rating": 4.3},
-                    {"name": "린쿠 온천", "address": "이즈미사노시 린쿠오라이키타 1-32", "lat": 34.4328, "lng": 135.2968, "rating": 4.1},
-                ],
-                "스파": [
-                    {"name": "스파월드 월드", "address": "오사카시 나니와구 에비스히가시 3-4-24", "lat": 34.6510, "lng": 135.5065, "rating": 4.3},
-                    {"name": "만요 클럽 오사카", "address": "오사카시 키타구 우메다 1-9-20", "lat": 34.7015, "lng": 135.4978, "rating": 4.1},
-                    {"name": "오사카 게스트하우스 스파", "address": "오사카시 중앙구 도톤보리 2-3", "lat": 34.6685, "lng": 135.5020, "rating": 4.0},
-                    {"name": "더 리츠칼튼 오사카 스파", "address": "오사카시 키타구 우메다 2-5-25", "lat": 34.7002, "lng": 135.4920, "rating": 4.6},
-                    {"name": "세인트레지스 오사카 스파", "address": "오사카시 중앙구 혼마치 3-6-12", "lat": 34.6835, "lng": 135.5005, "rating": 4.5},
-                ],
-                "공원": [
-                    {"name": "오사카성 공원", "address": "오사카시 중앙구 오사카조 1-1", "lat": 34.6873, "lng": 135.5262, "rating": 4.6},
-                    {"name": "나카노시마 공원", "address": "오사카시 키타구 나카노시마 1", "lat": 34.6915, "lng": 135.5030, "rating": 4.4},
-                    {"name": "텐노지 공원", "address": "오사카시 텐노지구 치야야마초", "lat": 34.6515, "lng": 135.5120, "rating": 4.3},
-                    {"name": "쓰루미료쿠치 공원", "address": "오사카시 쓰루미구 료쿠치공원 2-163", "lat": 34.7165, "lng": 135.5770, "rating": 4.4},
-                    {"name": "스미요시 공원", "address": "오사카시 스미요시구 스미요시 2-9", "lat": 34.6130, "lng": 135.4925, "rating": 4.2},
-                ],
-                "액티비티": [
-                    {"name": "유니버설 스튜디오 재팬", "address": "오사카시 코노하나구 사쿠라지마 2-1-33", "lat": 34.6654, "lng": 135.4323, "rating": 4.5},
-                    {"name": "오사카 해유관", "address": "오사카시 미나토구 가이간도리 1-1-10", "lat": 34.6545, "lng": 135.4287, "rating": 4.6},
-                    {"name": "레고랜드 디스커버리 센터 오사카", "address": "오사카시 미나토구 가이간도리 1-1-10", "lat": 34.6548, "lng": 135.4292, "rating": 4.2},
-                    {"name": "덴덴타운 게임센터", "address": "오사카시 나니와구 닛폰바시 4-12", "lat": 34.6598, "lng": 135.5056, "rating": 4.1},
-                    {"name": "라운드원 스타디움 도톤보리점", "address": "오사카시 중앙구 소에몬쵸 7-24", "lat": 34.6695, "lng": 135.5030, "rating": 4.0},
-                ],
-                "체험": [
-                    {"name": "컵라면 박물관 오사카이케다", "address": "이케다시 마스미쵸 8-25", "lat": 34.8249, "lng": 135.4312, "rating": 4.5},
-                    {"name": "도톤보리 타코야키 체험", "address": "오사카시 중앙구 도톤보리 1-9", "lat": 34.6688, "lng": 135.5015, "rating": 4.3},
-                    {"name": "기모노 체험 와사비", "address": "오사카시 중앙구 신사이바시스지 1-4", "lat": 34.6740, "lng": 135.5015, "rating": 4.4},
-                    {"name": "닌자 VR 체험", "address": "오사카시 중앙구 도톤보리 1-6", "lat": 34.6685, "lng": 135.5012, "rating": 4.1},
-                    {"name": "사무라이 검술 체험", "address": "오사카시 중앙구 닛폰바시 2-5", "lat": 34.6670, "lng": 135.5065, "rating": 4.3},
-                ],
-                "투어": [
-                    {"name": "도톤보리 리버크루즈", "address": "오사카시 중앙구 도톤보리", "lat": 34.6687, "lng": 135.5010, "rating": 4.4},
-                    {"name": "오사카성 요코부네", "address": "오사카시 중앙구 오사카조 3-1", "lat": 34.6850, "lng": 135.5290, "rating": 4.3},
-                    {"name": "아쿠아라이너 수상버스", "address": "오사카시 중앙구 오사카조 2", "lat": 34.6870, "lng": 135.5250, "rating": 4.2},
-                    {"name": "산토리 야마자키 증류소 투어", "address": "시마모토쵸 야마자키 5-2-1", "lat": 34.8950, "lng": 135.6650, "rating": 4.6},
-                    {"name": "오사카 덕 투어", "address": "오사카시 키타구 나카노시마 1-1", "lat": 34.6915, "lng": 135.5030, "rating": 4.3},
-                ],
-            },
-            "도쿄": {
-                "맛집": [
-                    {"name": "츠키지 스시다이", "address": "도쿄도 츄오구 츠키지 4-13-9", "lat": 35.6654, "lng": 139.7707, "rating": 4.5},
-                    {"name": "이치란 라멘 시부야점", "address": "도쿄도 시부야구 진난 1-22-7", "lat": 35.6623, "lng": 139.6993, "rating": 4.4},
-                    {"name": "후쿠쥬 교자", "address": "도쿄도 시부야구 에비스미나미 1-1-1", "lat": 35.6467, "lng": 139.7103, "rating": 4.3},
-                    {"name": "스키야바시 지로 본점", "address": "도쿄도 츄오구 긴자 4-2-15", "lat": 35.6712, "lng": 139.7640, "rating": 4.7},
-                    {"name": "아후리 라멘 에비스 본점", "address": "도쿄도 시부야구 에비스 1-1-7", "lat": 35.6473, "lng": 139.7100, "rating": 4.3},
-                ],
-                "관광지": [
-                    {"name": "센소지", "address": "도쿄도 다이토구 아사쿠사 2-3-1", "lat": 35.7147, "lng": 139.7966, "rating": 4.5},
-                    {"name": "도쿄 스카이트리", "address": "도쿄도 스미다구 오시아게 1-1-2", "lat": 35.7100, "lng": 139.8107, "rating": 4.6},
-                    {"name": "메이지 신궁", "address": "도쿄도 시부야구 요요기카미조노쵸 1-1", "lat": 35.6763, "lng": 139.6993, "rating": 4.6},
-                    {"name": "도쿄타워", "address": "도쿄도 미나토구 시바코엔 4-2-8", "lat": 35.6585, "lng": 139.7454, "rating": 4.4},
-                    {"name": "황거 동어원", "address": "도쿄도 치요다구 치요다 1-1", "lat": 35.6852, "lng": 139.7528, "rating": 4.5},
-                ],
-                "포토스팟": [
-                    {"name": "시부야 스크램블 교차로", "address": "도쿄도 시부야구 도겐자카 2", "lat": 35.6595, "lng": 139.7004, "rating": 4.4},
-                    {"name": "도쿄역 마루노우치 역사", "address": "도쿄도 치요다구 마루노우치 1-9-1", "lat": 35.6812, "lng": 139.7671, "rating": 4.5},
-                    {"name": "오다이바 레인보우 브릿지", "address": "도쿄도 미나토구 다이바", "lat": 35.6370, "lng": 139.7628, "rating": 4.4},
-                    {"name": "나카메구로 벚꽃길", "address": "도쿄도 메구로구 나카메구로 1", "lat": 35.6443, "lng": 139.6993, "rating": 4.5},
-                    {"name": "teamLab Borderless", "address": "도쿄도 코토구 아오미 1-3-8", "lat": 35.6267, "lng": 139.7837, "rating": 4.7},
-                ],
-                "쇼핑": [
-                    {"name": "긴자 식스", "address": "도쿄도 츄오구 긴자 6-10-1", "lat": 35.6698, "lng": 139.7633, "rating": 4.3},
-                    {"name": "하라주쿠 타케시타도리", "address": "도쿄도 시부야구 진구마에 1-17", "lat": 35.6722, "lng": 139.7054, "rating": 4.2},
-                    {"name": "시부야 109", "address": "도쿄도 시부야구 도겐자카 2-29-1", "lat": 35.6592, "lng": 139.6997, "rating": 4.1},
-                    {"name": "아키하바라 전자상가", "address": "도쿄도 치요다구 소토칸다 1", "lat": 35.6984, "lng": 139.7731, "rating": 4.3},
-                    {"name": "아메요코 시장", "address": "도쿄도 다이토구 우에노 4", "lat": 35.7102, "lng": 139.7749, "rating": 4.2},
-                ],
-            },
-            "교토": {
-                "맛집": [
-                    {"name": "기온 나루미", "address": "교토시 히가시야마구 기온마치 미나미가와 570-123", "lat": 35.0039, "lng": 135.7756, "rating": 4.4},
-                    {"name": "멘바카 이치다이", "address": "교토시 카미교구 이치조도리 니시", "lat": 35.0294, "lng": 135.7540, "rating": 4.5},
-                    {"name": "이노다 커피 본점", "address": "교토시 나카교구 도미노코지도리 산조사가루", "lat": 35.0088, "lng": 135.7612, "rating": 4.3},
-                    {"name": "니시키 시장", "address": "교토시 나카교구 니시키코지도리", "lat": 35.0050, "lng": 135.7640, "rating": 4.4},
-                    {"name": "오메닌도", "address": "교토시 히가시야마구 기요미즈 2-211", "lat": 35.0014, "lng": 135.7800, "rating": 4.2},
-                ],
-                "관광지": [
-                    {"name": "킨카쿠지 (금각사)", "address": "교토시 키타구 킨카쿠지쵸 1", "lat": 35.0394, "lng": 135.7292, "rating": 4.6},
-                    {"name": "후시미 이나리 타이샤", "address": "교토시 후시미구 후카쿠사야부노우치쵸 68", "lat": 34.9671, "lng": 135.7727, "rating": 4.7},
-                    {"name": "기요미즈데라", "address": "교토시 히가시야마구 기요미즈 1-294", "lat": 34.9948, "lng": 135.7850, "rating": 4.6},
-                    {"name": "아라시야마 대나무숲", "address": "교토시 우쿄구 사가텐류지 스스키노바바쵸", "lat": 35.0168, "lng": 135.6713, "rating": 4.5},
-                    {"name": "니조성", "address": "교토시 나카교구 니조조마에 541", "lat": 35.0142, "lng": 135.7481, "rating": 4.5},
-                ],
-                "포토스팟": [
-                    {"name": "야사카 탑", "address": "교토시 히가시야마구 야사카카미마치 388", "lat": 34.9987, "lng": 135.7790, "rating": 4.5},
-                    {"name": "아라시야마 대나무숲", "address": "교토시 우쿄구 사가텐류지 스스키노바바쵸", "lat": 35.0168, "lng": 135.6713, "rating": 4.5},
-                    {"name": "기온 거리", "address": "교토시 히가시야마구 기온마치", "lat": 35.0039, "lng": 135.7756, "rating": 4.4},
-                    {"name": "철학의 길", "address": "교토시 사쿄구 긴카쿠지쵸", "lat": 35.0270, "lng": 135.7945, "rating": 4.4},
-                    {"name": "토게츠쿄 다리", "address": "교토시 우쿄구 아라시야마", "lat": 35.0106, "lng": 135.6780, "rating": 4.5},
-                ],
-            },
-            "제주도": {
-                "맛집": [
-                    {"name": "올래국수", "address": "제주시 귀아랑길 24", "lat": 33.5121, "lng": 126.5232, "rating": 4.4},
-                    {"name": "삼대국수회관", "address": "제주시 삼성로 67", "lat": 33.4996, "lng": 126.5287, "rating": 4.3},
-                    {"name": "돈사돈 본점", "address": "제주시 노형동 925-4", "lat": 33.4856, "lng": 126.4923, "rating": 4.5},
-                    {"name": "제주김만복 본점", "address": "제주시 한라대학로 38", "lat": 33.5012, "lng": 126.5287, "rating": 4.4},
-                    {"name": "명진전복 본점", "address": "제주시 조천읍 조함해안로 502", "lat": 33.5025, "lng": 126.5412, "rating": 4.3},
-                ],
-                "관광지": [
-                    {"name": "성산일출봉", "address": "서귀포시 성산읍 일출로 284-12", "lat": 33.4587, "lng": 126.9425, "rating": 4.7},
-                    {"name": "만장굴", "address": "제주시 구좌읍 만장굴길 182", "lat": 33.5282, "lng": 126.7712, "rating": 4.5},
-                    {"name": "천지연폭포", "address": "서귀포시 천지동 667-7", "lat": 33.2469, "lng": 126.5548, "rating": 4.4},
-                    {"name": "한라산 어리목 코스", "address": "제주시 해안동 산220-1", "lat": 33.3617, "lng": 126.4969, "rating": 4.6},
-                    {"name": "협재해수욕장", "address": "제주시 한림읍 협재리 2497-1", "lat": 33.3939, "lng": 126.2395, "rating": 4.5},
-                ],
-                "포토스팟": [
-                    {"name": "섭지코지", "address": "서귀포시 성산읍 섭지코지로 107", "lat": 33.4240, "lng": 126.9296, "rating": 4.5},
-                    {"name": "사려니숲길", "address": "제주시 조천읍 교래리 산137-1", "lat": 33.4350, "lng": 126.6520, "rating": 4.6},
-                    {"name": "카멜리아힐", "address": "서귀포시 안덕면 병악로 166", "lat": 33.2898, "lng": 126.3689, "rating": 4.4},
-                    {"name": "함덕서우봉해변", "address": "제주시 조천읍 조함해안로 525", "lat": 33.5432, "lng": 126.6698, "rating": 4.5},
-                    {"name": "새별오름", "address": "제주시 애월읍 봉성리", "lat": 33.3620, "lng": 126.3530, "rating": 4.5},
-                ],
-                "액티비티": [
-                    {"name": "우도", "address": "제주시 우도면", "lat": 33.5063, "lng": 126.9520, "rating": 4.6},
-                    {"name": "아쿠아플라넷 제주", "address": "서귀포시 성산읍 섭지코지로 95", "lat": 33.4337, "lng": 126.9269, "rating": 4.4},
-                    {"name": "제주 레일바이크", "address": "제주시 구좌읍 용눈이오름로", "lat": 33.4610, "lng": 126.8320, "rating": 4.3},
-                    {"name": "제주 동문시장 야시장", "address": "제주시 동문로 14", "lat": 33.5125, "lng": 126.5260, "rating": 4.3},
-                    {"name": "카약체험 애월", "address": "제주시 애월읍 애월리", "lat": 33.4620, "lng": 126.3185, "rating": 4.4},
-                ],
-            },
-            "부산": {
-                "맛집": [
-                    {"name": "할매국밥 본점", "address": "부산시 중구 구덕로 24", "lat": 35.1030, "lng": 129.0312, "rating": 4.4},
-                    {"name": "원조 할매낙곱새", "address": "부산시 부산진구 서전로37번길 20", "lat": 35.1545, "lng": 129.0595, "rating": 4.5},
-                    {"name": "밀면 본가", "address": "부산시 중구 대청로126번길 7", "lat": 35.1046, "lng": 129.0328, "rating": 4.3},
-                    {"name": "삼진어묵 본점", "address": "부산시 영도구 태종로99번길 36", "lat": 35.0875, "lng": 129.0535, "rating": 4.4},
-                    {"name": "부산 자갈치시장", "address": "부산시 중구 자갈치해안로 52", "lat": 35.0966, "lng": 129.0305, "rating": 4.3},
-                ],
-                "관광지": [
-                    {"name": "해운대 해수욕장", "address": "부산시 해운대구 해운대해변로 264", "lat": 35.1587, "lng": 129.1604, "rating": 4.5},
-                    {"name": "감천문화마을", "address": "부산시 사하구 감내2로 203", "lat": 35.0972, "lng": 129.0105, "rating": 4.4},
-                    {"name": "광안리 해수욕장", "address": "부산시 수영구 광안해변로 219", "lat": 35.1532, "lng": 129.1186, "rating": 4.4},
-                    {"name": "해동용궁사", "address": "부산시 기장군 기장읍 용궁길 86", "lat": 35.1881, "lng": 129.2232, "rating": 4.5},
-                    {"name": "태종대", "address": "부산시 영도구 전망로 24", "lat": 35.0536, "lng": 129.0843, "rating": 4.4},
-                ],
-                "포토스팟": [
-                    {"name": "흰여울문화마을", "address": "부산시 영도구 영선동4가", "lat": 35.0768, "lng": 129.0452, "rating": 4.4},
-                    {"name": "해운대 달맞이길", "address": "부산시 해운대구 중동 산12-1", "lat": 35.1565, "lng": 129.1750, "rating": 4.3},
-                    {"name": "이기대 해안산책로", "address": "부산시 남구 이기대공원로", "lat": 35.1148, "lng": 129.1185, "rating": 4.5},
-                    {"name": "송정해수욕장", "address": "부산시 해운대구 송정해변로 62", "lat": 35.1785, "lng": 129.1998, "rating": 4.4},
-                    {"name": "감천문화마을 어린왕자 포토존", "address": "부산시 사하구 감내2로 203", "lat": 35.0972, "lng": 129.0105, "rating": 4.4},
-                ],
-            },
-            "방콕": {
-                "맛집": [
-                    {"name": "팁사마이 (Thip Samai)", "address": "313 Maha Chai Rd, Samran Rat, Bangkok", "lat": 13.7512, "lng": 100.5015, "rating": 4.4},
-                    {"name": "라안 가이톤 프라투남", "address": "960 Phetchaburi Rd, Bangkok", "lat": 13.7514, "lng": 100.5395, "rating": 4.5},
-                    {"name": "로디 (Roti Mataba)", "address": "136 Phra Athit Rd, Phra Borom Maha, Bangkok", "lat": 13.7608, "lng": 100.4932, "rating": 4.3},
-                    {"name": "솜분 씨푸드", "address": "895/6-21 Rama I Rd, Wang Mai, Pathum Wan", "lat": 13.7460, "lng": 100.5330, "rating": 4.3},
-                    {"name": "나이어트 푸드코트", "address": "555 Rajadamri Rd, Lumphini, Pathum Wan", "lat": 13.7440, "lng": 100.5395, "rating": 4.2},
-                ],
-                "관광지": [
-                    {"name": "왓 프라깨우 (에메랄드 사원)", "address": "Na Phra Lan Rd, Phra Borom, Bangkok", "lat": 13.7516, "lng": 100.4927, "rating": 4.7},
-                    {"name": "왓 아룬 (새벽 사원)", "address": "158 Wang Doem Road, Wat Arun, Bangkok", "lat": 13.7437, "lng": 100.4889, "rating": 4.6},
-                    {"name": "왕궁 (Grand Palace)", "address": "Na Phra Lan Rd, Phra Borom, Bangkok", "lat": 13.7500, "lng": 100.4913, "rating": 4.6},
-                    {"name": "짜뚜짝 주말시장", "address": "Kamphaeng Phet 2 Rd, Chatuchak, Bangkok", "lat": 13.7999, "lng": 100.5506, "rating": 4.4},
-                    {"name": "왓 포", "address": "2 Sanam Chai Rd, Phra Borom Maha, Bangkok", "lat": 13.7465, "lng": 100.4927, "rating": 4.6},
-                ],
-                "포토스팟": [
-                    {"name": "아이콘시암", "address": "299 Charoen Nakhon Rd, Khlong Ton Sai, Khlong San", "lat": 13.7263, "lng": 100.5100, "rating": 4.5},
-                    {"name": "카오산 로드", "address": "Khaosan Rd, Talat Yot, Phra Nakhon, Bangkok", "lat": 13.7589, "lng": 100.4970, "rating": 4.2},
-                    {"name": "마하나콘 스카이워크", "address": "114 Narathiwat Rd, Silom, Bang Rak", "lat": 13.7235, "lng": 100.5269, "rating": 4.5},
-                    {"name": "왓 팍남 대형 불상", "address": "Wat Paknam Phasi Charoen, Bangkok", "lat": 13.7215, "lng": 100.4765, "rating": 4.5},
-                    {"name": "아시아티크 더 리버프론트", "address": "2194 Charoen Krung Rd, Wat Phraya Krai, Bangkok", "lat": 13.7038, "lng": 100.5014, "rating": 4.3},
-                ],
-            },
-            "파리": {
-                "맛집": [
-                    {"name": "르 꽁투아 뒤 팡테옹", "address": "5 Rue Soufflot, 75005 Paris", "lat": 48.8462, "lng": 2.3439, "rating": 4.4},
-                    {"name": "르 프로콥", "address": "13 Rue de l'Ancienne Comédie, 75006 Paris", "lat": 48.8531, "lng": 2.3390, "rating": 4.3},
-                    {"name": "세셰롱", "address": "7 Rue de la Grande Chaumière, 75006 Paris", "lat": 48.8442, "lng": 2.3315, "rating": 4.5},
-                    {"name": "카페 드 플로르", "address": "172 Boulevard Saint-Germain, 75006 Paris", "lat": 48.8540, "lng": 2.3325, "rating": 4.2},
-                    {"name": "라뒤레 샹젤리제점", "address": "75 Avenue des Champs-Élysées, 75008 Paris", "lat": 48.8711, "lng": 2.3042, "rating": 4.4},
-                ],
-                "관광지": [
-                    {"name": "에펠탑", "address": "Champ de Mars, 5 Avenue Anatole France, 75007 Paris", "lat": 48.8584, "lng": 2.2945, "rating": 4.7},
-                    {"name": "루브르 박물관", "address": "Rue de Rivoli, 75001 Paris", "lat": 48.8606, "lng": 2.3376, "rating": 4.8},
-                    {"name": "개선문", "address": "Place Charles de Gaulle, 75008 Paris", "lat": 48.8738, "lng": 2.2950, "rating": 4.6},
-                    {"name": "노트르담 대성당", "address": "6 Parvis Notre-Dame, 75004 Paris", "lat": 48.8530, "lng": 2.3499, "rating": 4.7},
-                    {"name": "몽마르트르 사크레쾨르 대성당", "address": "35 Rue du Chevalier de la Barre, 75018 Paris", "lat": 48.8867, "lng": 2.3431, "rating": 4.6},
-                ],
-                "포토스팟": [
-                    {"name": "트로카데로 광장", "address": "Place du Trocadéro, 75016 Paris", "lat": 48.8624, "lng": 2.2879, "rating": 4.5},
-                    {"name": "퐁 데자르 (예술의 다리)", "address": "Pont des Arts, 75006 Paris", "lat": 48.8583, "lng": 2.3375, "rating": 4.4},
-                    {"name": "몽마르트르 언덕", "address": "Montmartre, 75018 Paris", "lat": 48.8867, "lng": 2.3431, "rating": 4.5},
-                    {"name": "튈르리 정원", "address": "Place de la Concorde, 75001 Paris", "lat": 48.8634, "lng": 2.3275, "rating": 4.4},
-                    {"name": "뤽상부르 공원", "address": "75006 Paris", "lat": 48.8462, "lng": 2.3371, "rating": 4.6},
-                ],
-            },
-        }
-
-        # 쿼리 키워드 정규화 - 다양한 검색어를 카테고리에 매핑
-        query_lower = query.lower()
-        query_normalized = query
-
-        # 검색어 매핑
-        query_mappings = {
-            "맛집": ["맛집", "레스토랑", "현지 음식", "음식점", "식당"],
-            "관광지": ["관광지", "명소", "랜드마크", "볼거리"],
-            "포토스팟": ["포토스팟", "뷰포인트", "인스타그램", "사진", "촬영"],
-            "쇼핑": ["쇼핑", "시장", "백화점", "아울렛"],
-            "온천": ["온천", "스파", "휴식"],
-            "공원": ["공원", "정원"],
-            "액티비티": ["액티비티", "체험", "투어", "놀거리"],
+        city, category = _resolve_mock_bucket(query, location)
+        # 같은 (지역, 카테고리, 개수)의 포맷 결과는 캐시된 것을 재사용하되, 캐시가 오염되지
+        # 않도록 호출자에게는 복사본을 반환 (types는 tuple이라 공유해도 안전)
+        return [
+            {**place, "location": dict(place["location"])}
+            for place in _format_mock_places(city, category, max_results)
+        ]
+
+    def _get_mock_place_details_by_id(self, place_id: str) -> Dict[str, Any]:
+        """Mock 검색 결과의 place_id로 Mock 장소 상세 데이터 생성."""
+        place = _mock_places_by_id().get(place_id)
+        if place is None:
+            return {"place_id": place_id, "error": "Unknown mock place_id"}
+
+        name, address, lat, lng, rating = place
+        return {
+            "place_id": place_id,
+            "name": name,
+            "address": address,
+            "location": {"lat": lat, "lng": lng},
+            **_MOCK_DETAIL_TEMPLATE,
+            "rating": rating,
         }
 
-        for category, keywords in query_mappings.items():
-            if any(kw in query_lower for kw in keywords):
-                query_normalized = category
-                break
-
-        # 해당 지역의 장소 데이터 가져오기
-        location_data = None
-        for loc_key in real_places_db:
-            if loc_key in location:
-                location_data = real_places_db[loc_key]
-                break
-
-        if not location_data:
-            # 기본 지역으로 오사카 사용
-            location_data = real_places_db.get("오사카", {})
-
-        # 해당 카테고리의 장소 찾기
-        places = location_data.get(query_normalized, [])
-
-        # 해당 카테고리가 없으면 유사 카테고리 시도
-        if not places:
-            for cat in location_data:
-                if query_normalized.lower() in cat.lower() or cat.lower() in query_normalized.lower():
-                    places = location_data[cat]
-                    break
-
-        # 여전히 없으면 맛집 또는 관광지 기본값 사용
-        if not places:
-            places = location_data.get("맛집", location_data.get("관광지", []))
-
-        # 결과 포맷팅
-        mock_places = []
-        for i, place in enumerate(places[:max_results]):
-            mock_places.append({
-                "place_id": f"real_place_{i}_{place['name'][:10]}",
-                "name": place["name"],
-                "address": place["address"],
-                "location": {
-                    "lat": place["lat"],
-                    "lng": place["lng"],
-                },
-                "rating": place.get("rating", 4.3),
-                "user_ratings_total": 300 + (i * 50),
-                "types": ["establishment"],
-                "price_level": min(i + 1, 4),
-                "open_now": True,
-            })
-
-        return mock_places
-
     def _get_mock_place_details(
         self,
         place_name: str,
         location: str,
     ) -> Dict[str, Any]:
         """Mock 장소 상세 데이터 생성."""
-        location_coords = {
-            "오사카": (34.6937, 135.5023),
-            "도쿄": (35.6762, 139.6503),
-        }
-
-        base_lat, base_lng = location_coords.get(location, (35.6762, 139.6503))
+        base_lat, base_lng = _mock_city_coords().get(location, _DEFAULT_CITY_COORDS)
 
         return {
             "place_id": f"mock_{place_name}",
             "name": place_name,
             "address": f"{location} 중심가",
             "location": {"lat": base_lat, "lng": base_lng},
-            "rating": 4.3,
-            "user_ratings_total": 350,
-            "price_level": 2,
-            "opening_hours": ["월-금: 10:00-22:00", "토-일: 11:00-21:00"],
-            "website": None,
-            "phone": None,
-            "types": ["establishment"],
-            "reviews": [
-                {"rating": 5, "text": "정말 좋았어요!", "time": "일주일 전"},
-                {"rating": 4, "text": "분위기가 좋습니다", "time": "한달 전"},
-            ],
+            **_MOCK_DETAIL_TEMPLATE,
         }
 
 
@@ -1,9 +1,26 @@
 """Translation tool using OpenAI."""
 
-from typing import Dict, Optional
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional
 from core.logger import logger
 
 
+def _normalize_phrase(text: str) -> str:
+    """Normalize a phrase for dictionary lookup (공백 제거 + NFC 정규화)."""
+    return unicodedata.normalize("NFC", text.strip())
+
+
+def _index_by_source(
+    phrases_by_language: Dict[str, Dict[str, str]],
+) -> Dict[str, Dict[str, str]]:
+    """Invert {언어: {원문: 번역}} into {원문: {언어: 번역}}."""
+    index: Dict[str, Dict[str, str]] = {}
+    for lang, phrases in phrases_by_language.items():
+        for src, dst in phrases.items():
+            index.setdefault(src, {})[lang] = dst
+    return index
+
+
 class TranslateTool:
     """번역 도구 (OpenAI 기반)."""
 
@@ -22,7 +39,7 @@ class TranslateTool:
     }
 
     # 자주 쓰는 여행 표현 사전 (오프라인 대비)
-    COMMON_PHRASES = {
+    _RAW_COMMON_PHRASES = {
         "ja": {
             "안녕하세요": "こんにちは (Konnichiwa)",
             "감사합니다": "ありがとうございます (Arigatou gozaimasu)",
@@ -58,6 +75,15 @@ class TranslateTool:
         },
     }
 
+    # 조회용 사전: 키를 미리 정규화해 두어 입력만 한 번 정규화하면 됨
+    COMMON_PHRASES = {
+        lang: {_normalize_phrase(src): dst for src, dst in phrases.items()}
+        for lang, phrases in _RAW_COMMON_PHRASES.items()
+    }
+
+    # 원문 -> {언어: 번역} 역색인 (한 표현을 여러 언어로 조회할 때 한 번만 검색)
+    _BY_SOURCE = _index_by_source(COMMON_PHRASES)
+
     async def translate_text(
         self,
         text: str,
@@ -79,15 +105,15 @@ class TranslateTool:
         source_language = source_language.lower()
 
         # 자주 쓰는 표현인지 확인
-        if target_language in self.COMMON_PHRASES:
-            phrases = self.COMMON_PHRASES[target_language]
-            normalized_text = text.strip()
+        phrases = self.COMMON_PHRASES.get(target_language)
+        if phrases:
+            translated = phrases.get(_normalize_phrase(text))
 
-            if normalized_text in phrases:
+            if translated is not None:
                 logger.debug(f"Found cached translation for: {text}")
                 return {
                     "original": text,
-                    "translated": phrases[normalized_text],
+                    "translated": translated,
                     "source_language": source_language,
                     "target_language": target_language,
                     "source_language_name": self.LANGUAGE_NAMES.get(source_language, source_language),
@@ -108,6 +134,54 @@ class TranslateTool:
             "needs_ai_translation": True,
         }
 
+    async def translate_many(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: str = "ko",
+    ) -> Dict[str, Any]:
+        """
+        여러 텍스트를 한 번에 번역합니다.
+
+        사전에 있는 표현은 바로 채우고, 나머지는 pending_indices로 모아
+        서비스 레이어가 한 번의 AI 요청으로 번역할 수 있게 합니다.
+
+        Args:
+            texts: 번역할 텍스트 목록
+            target_language: 대상 언어 코드
+            source_language: 원본 언어 코드
+
+        Returns:
+            입력 순서대로의 번역 결과와 AI 번역이 필요한 항목의 인덱스
+        """
+        target_language = target_language.lower()
+        source_language = source_language.lower()
+        phrases = self.COMMON_PHRASES.get(target_language, {})
+
+        items = []
+        pending_indices = []
+        for i, text in enumerate(texts):
+            translated = phrases.get(_normalize_phrase(text))
+            if translated is None:
+                pending_indices.append(i)
+            items.append({"original": text, "translated": translated})
+
+        if pending_indices:
+            logger.info(
+                f"Translation request: {source_language} -> {target_language} "
+                f"({len(pending_indices)}/{len(texts)} texts)"
+            )
+
+        return {
+            "items": items,
+            "source_language": source_language,
+            "target_language": target_language,
+            "source_language_name": self.LANGUAGE_NAMES.get(source_language, source_language),
+            "target_language_name": self.LANGUAGE_NAMES.get(target_language, target_language),
+            "needs_ai_translation": bool(pending_indices),
+            "pending_indices": pending_indices,
+        }
+
     def get_common_phrases(
         self,
         target_language: str,
@@ -123,6 +197,27 @@ class TranslateTool:
         """
         return self.COMMON_PHRASES.get(target_language.lower(), {})
 
+    def translate_bulk(
+        self,
+        text: str,
+        target_languages: Iterable[str],
+    ) -> Dict[str, Optional[str]]:
+        """
+        자주 쓰는 표현을 여러 언어로 한 번에 조회합니다.
+
+        Args:
+            text: 원문 (한국어)
+            target_languages: 대상 언어 코드 목록
+
+        Returns:
+            언어 코드별 번역 (사전에 없으면 None)
+        """
+        translations = self._BY_SOURCE.get(_normalize_phrase(text), {})
+        return {
+            lang.lower(): translations.get(lang.lower())
+            for lang in target_languages
+        }
+
     def get_supported_languages(self) -> Dict[str, str]:
         """지원하는 언어 목록 반환."""
         return self.LANGUAGE_NAMES.copy()